@@ -2,7 +2,7 @@
 """Manage acceptance criteria for tusk tasks.
 
 Called by the tusk wrapper:
-    tusk criteria add|list|done|reset ...
+    tusk criteria add|add-many|list|done|reset ...
 
 Arguments received from tusk:
     sys.argv[1] — DB path
@@ -11,7 +11,10 @@ Arguments received from tusk:
 """
 
 import argparse
+import contextlib
+import functools
 import glob as globmod
+import itertools
 import json
 import os
 import re
@@ -20,6 +23,7 @@ import sqlite3
 import subprocess
 import sys
 import time
+from datetime import datetime, timezone
 from typing import Optional
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -498,6 +502,64 @@ def run_verification(criterion_type: str, spec: str) -> dict:
 
 SPEC_REQUIRED_TYPES = {"code", "test", "file"}
 
+# Mirrors the acceptance_criteria.source CHECK constraint; `add --source`
+# and `add-many` both validate against it.
+CRITERION_SOURCES = ("original", "subsumption", "pr_review")
+
+# Hot-path statements, hoisted so every call passes the same SQL text and hits
+# the connection's prepared-statement cache (sqlite3 keys it by SQL string;
+# the default cached_statements=128 is ample for one CLI invocation).
+_SQL_INSERT_CRITERION = (
+    "INSERT INTO acceptance_criteria (task_id, criterion, source, criterion_type, verification_spec) "
+    "SELECT ?, ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM tasks WHERE id = ?)"
+)
+_SQL_INSERT_CRITERION_BATCH = (
+    "INSERT INTO acceptance_criteria (task_id, criterion, source) VALUES (?, ?, ?)"
+)
+_LIST_CRITERIA_COLUMNS = (
+    "id", "criterion", "source", "is_completed", "is_deferred", "deferred_reason",
+    "cost_dollars", "tokens_in", "tokens_out",
+    "criterion_type", "verification_spec", "commit_hash", "committed_at",
+    "skip_note", "created_at",
+)
+# One round trip for the task header and its criteria: the LEFT JOIN yields no
+# row when the task is missing and a single all-NULL criterion row when the
+# task exists but has no criteria.
+_SQL_LIST_CRITERIA = (
+    "SELECT t.summary AS task_summary, "
+    + ", ".join(f"c.{col}" for col in _LIST_CRITERIA_COLUMNS)
+    + " FROM tasks t LEFT JOIN acceptance_criteria c ON c.task_id = t.id "
+    "WHERE t.id = ? ORDER BY c.id"
+)
+_SQL_GET_CRITERION_FOR_DONE = (
+    "SELECT id, task_id, criterion, is_completed, criterion_type, verification_spec, "
+    "is_deferred, deferred_reason, commit_hash, committed_at "
+    "FROM acceptance_criteria WHERE id = ?"
+)
+_SQL_MARK_DONE = (
+    "UPDATE acceptance_criteria SET is_completed = 1, "
+    "completed_at = strftime('%Y-%m-%d %H:%M:%f', 'now'), "
+    "commit_hash = ?, committed_at = ?, "
+    "verification_result = ?, skip_note = ?, "
+    "is_deferred = 0, "
+    "updated_at = ? WHERE id = ? AND is_completed = 0"
+)
+_SQL_GET_DONE_STAMP = (
+    "SELECT completed_at, commit_hash FROM acceptance_criteria WHERE id = ?"
+)
+_SQL_MARK_RESET = (
+    "UPDATE acceptance_criteria SET is_completed = 0, completed_at = NULL, "
+    "cost_dollars = NULL, tokens_in = NULL, tokens_out = NULL, "
+    "verification_result = NULL, commit_hash = NULL, committed_at = NULL, "
+    "is_deferred = 0, deferred_reason = NULL, skip_note = NULL, "
+    "updated_at = ? "
+    "WHERE id = ? AND (is_completed = 1 OR is_deferred = 1)"
+)
+_SQL_GET_CRITERION_FOR_RESET = (
+    "SELECT task_id, criterion, is_completed, is_deferred "
+    "FROM acceptance_criteria WHERE id = ?"
+)
+
 
 def _normalize_spec(spec: str | None) -> str | None:
     """Collapse empty/whitespace-only specs to None so '' never reaches the DB (issue #1045)."""
@@ -506,6 +568,11 @@ def _normalize_spec(spec: str | None) -> str | None:
     return spec
 
 
+def _utc_now_sql() -> str:
+    """Current UTC time in SQLite's datetime('now') format, for binding as a param."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
 # ── Subcommands ──────────────────────────────────────────────────────
 
 def _normalized_criterion_text(text: str) -> str:
@@ -534,50 +601,47 @@ def _find_superseded_criteria(
         (task_id, ctype),
     ).fetchall()
     superseded: list[int] = []
-    for row in rows:
-        if _normalized_criterion_text(row["criterion"]) != normalized_text:
+    for cid, criterion, old_spec in rows:
+        if _normalized_criterion_text(criterion) != normalized_text:
             continue
-        if row["verification_spec"] == spec:
+        if old_spec == spec:
             continue
-        superseded.append(row["id"])
+        superseded.append(cid)
     return superseded
 
 def cmd_add(args: argparse.Namespace, db_path: str, config: dict) -> int:
     spec = _normalize_spec(args.spec)
-    conn = get_connection(db_path)
-    try:
-        # Verify task exists
-        task = conn.execute("SELECT id FROM tasks WHERE id = ?", (args.task_id,)).fetchone()
-        if not task:
-            print(f"Error: Task {args.task_id} not found", file=sys.stderr)
-            return 2
 
-        # Validate criterion_type against config
-        criterion_types = config.get("criterion_types", [])
-        if criterion_types and args.type not in criterion_types:
-            joined = ", ".join(criterion_types)
-            print(f"Error: Invalid criterion type '{args.type}'. Valid: {joined}", file=sys.stderr)
-            return 2
+    # Validate criterion_type against config — all pure-Python checks run before
+    # get_connection so a rejected invocation never opens (or creates) the DB.
+    criterion_types = config.get("criterion_types", [])
+    if criterion_types and args.type not in criterion_types:
+        joined = ", ".join(criterion_types)
+        print(f"Error: Invalid criterion type '{args.type}'. Valid: {joined}", file=sys.stderr)
+        return 2
 
-        # Validate spec: required for non-manual types
-        if args.type in SPEC_REQUIRED_TYPES and not spec:
-            print(f"Error: --spec is required for criterion type '{args.type}'", file=sys.stderr)
-            return 2
+    # Validate spec: required for non-manual types
+    if args.type in SPEC_REQUIRED_TYPES and not spec:
+        print(f"Error: --spec is required for criterion type '{args.type}'", file=sys.stderr)
+        return 2
 
-        # Reject shell-substitution metacharacters in the criterion text before
-        # the insert (issue #1106 — extends the issue #881 commit-message guard).
-        # zsh/bash expand `, $(...), ${...}, and bare $IDENT before tusk sees the
-        # argv, even inside double quotes, silently corrupting stored content. The
-        # spec is intentionally NOT checked — it is shell code by design (run at
-        # criteria done time).
-        ok, diagnostic = reject_shell_metacharacters(args.text, subject="criterion text")
-        if not ok:
-            print(diagnostic, file=sys.stderr)
-            return 1
+    # Reject shell-substitution metacharacters in the criterion text before
+    # the insert (issue #1106 — extends the issue #881 commit-message guard).
+    # zsh/bash expand `, $(...), ${...}, and bare $IDENT before tusk sees the
+    # argv, even inside double quotes, silently corrupting stored content. The
+    # spec is intentionally NOT checked — it is shell code by design (run at
+    # criteria done time).
+    ok, diagnostic = reject_shell_metacharacters(args.text, subject="criterion text")
+    if not ok:
+        print(diagnostic, file=sys.stderr)
+        return 1
 
-        if args.type == "file":
-            warn_file_spec_glob_metachars(spec, "criteria add")
+    if args.type == "file":
+        warn_file_spec_glob_metachars(spec, "criteria add")
 
+    # No name-based row access below (rowcount/lastrowid and positional
+    # unpacking only), so skip the sqlite3.Row wrapper.
+    with contextlib.closing(get_connection(db_path, row_factory=None)) as conn:
         superseded_ids = _find_superseded_criteria(
             conn,
             task_id=args.task_id,
@@ -586,12 +650,20 @@ def cmd_add(args: argparse.Namespace, db_path: str, config: dict) -> int:
             spec=spec,
         )
 
-        conn.execute(
-            "INSERT INTO acceptance_criteria (task_id, criterion, source, criterion_type, verification_spec) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (args.task_id, args.text, args.source, args.type, spec),
+        # get_connection's isolation_level="IMMEDIATE" opens one BEGIN IMMEDIATE
+        # transaction at the INSERT, so the insert and any supersede updates
+        # share a single commit, and cur.lastrowid is guaranteed to be our row
+        # without a separate SELECT last_insert_rowid() round trip. The task
+        # existence check is folded into the same statement: the row is only
+        # produced when the task exists, so rowcount 0 means "not found".
+        cur = conn.execute(
+            _SQL_INSERT_CRITERION,
+            (args.task_id, args.text, args.source, args.type, spec, args.task_id),
         )
-        cid = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        if cur.rowcount == 0:
+            print(f"Error: Task {args.task_id} not found", file=sys.stderr)
+            return 2
+        cid = cur.lastrowid
 
         for old_id in superseded_ids:
             conn.execute(
@@ -611,50 +683,104 @@ def cmd_add(args: argparse.Namespace, db_path: str, config: dict) -> int:
             "superseded_criteria_ids": superseded_ids,
         }))
         return 0
-    finally:
-        conn.close()
 
 
-def cmd_list(args: argparse.Namespace, db_path: str, config: dict) -> int:
-    conn = get_connection(db_path)
-    try:
-        # Verify task exists
-        task = conn.execute(
-            "SELECT id, summary FROM tasks WHERE id = ?", (args.task_id,)
-        ).fetchone()
-        if not task:
+def _parse_add_many_lines(lines) -> tuple[list[tuple[str, str]], Optional[str]]:
+    """Parse ``criterion<TAB>source`` lines into (text, source) pairs.
+
+    Blank lines are skipped and a missing source defaults to 'original'.
+    Returns (rows, error); error is a message naming the first bad line.
+    The text is not run through reject_shell_metacharacters: it arrives via
+    stdin/--file, never argv, so the shell has no chance to expand it.
+    """
+    rows: list[tuple[str, str]] = []
+    for lineno, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        text, _, source = line.partition("\t")
+        text = text.strip()
+        source = source.strip() or "original"
+        if not text:
+            return [], f"line {lineno}: empty criterion text"
+        if source not in CRITERION_SOURCES:
+            joined = ", ".join(CRITERION_SOURCES)
+            return [], f"line {lineno}: invalid source '{source}'. Valid: {joined}"
+        rows.append((text, source))
+    return rows, None
+
+
+def cmd_add_many(args: argparse.Namespace, db_path: str, config: dict) -> int:
+    """Add many manual criteria to one task in a single transaction.
+
+    Reads ``criterion<TAB>source`` lines from --file (or stdin) and inserts
+    them with one executemany, so a bulk import pays for one BEGIN/COMMIT
+    instead of one per criterion. Input is validated in full before the DB
+    is opened; nothing is written unless every line is accepted.
+    """
+    # retry_on_locked re-runs this handler on lock contention and stdin can
+    # only be drained once, so the parsed rows are kept on args across retries.
+    rows = getattr(args, "rows", None)
+    if rows is None:
+        if args.file and args.file != "-":
+            try:
+                with open(args.file, encoding="utf-8") as f:
+                    lines = f.readlines()
+            except OSError as e:
+                print(f"Error: cannot read {args.file}: {e}", file=sys.stderr)
+                return 2
+        else:
+            lines = sys.stdin.readlines()
+
+        rows, error = _parse_add_many_lines(lines)
+        if error:
+            print(f"Error: {error}", file=sys.stderr)
+            return 2
+        args.rows = rows
+    if not rows:
+        print("Error: no criteria to add", file=sys.stderr)
+        return 2
+
+    with contextlib.closing(get_connection(db_path, row_factory=None)) as conn:
+        if conn.execute("SELECT 1 FROM tasks WHERE id = ?", (args.task_id,)).fetchone() is None:
             print(f"Error: Task {args.task_id} not found", file=sys.stderr)
             return 2
+        # Single BEGIN IMMEDIATE ... COMMIT around every insert; an error
+        # skips the commit and closing() discards the open transaction, so a
+        # partial import never lands.
+        conn.executemany(
+            _SQL_INSERT_CRITERION_BATCH,
+            ((args.task_id, text, source) for text, source in rows),
+        )
+        conn.commit()
 
-        rows = conn.execute(
-            "SELECT id, criterion, source, is_completed, is_deferred, deferred_reason, "
-            "cost_dollars, tokens_in, tokens_out, "
-            "criterion_type, verification_spec, commit_hash, committed_at, "
-            "skip_note, created_at "
-            "FROM acceptance_criteria WHERE task_id = ? ORDER BY id",
-            (args.task_id,),
-        ).fetchall()
-    finally:
-        conn.close()
+    print(dumps({"task_id": args.task_id, "added": len(rows)}))
+    return 0
 
-    if not pretty_requested():
-        payload = [dict(r) for r in rows]
-        print(dumps(payload))
-        return 0
 
-    if not rows:
-        print(f"No acceptance criteria for task #{args.task_id}: {task['summary']}")
-        return 0
+def _print_criteria_table(task_id: int, task_summary: str, rows) -> None:
+    """Render the --pretty criteria table in a single pass over ``rows``.
 
-    print(f"Acceptance criteria for task #{args.task_id}: {task['summary']}")
-    print(f"{'ID':<6} {'Done':<6} {'Type':<8} {'Source':<14} {'Cost':<10} {'Commit':<10} {'Committed At':<22} {'Criterion'}")
-    print("-" * 122)
+    ``rows`` may be a live cursor: the header is emitted lazily on the first
+    row and completed/deferred/cost totals are counted as rows stream by, so
+    the result set is never materialized. Lines are buffered and written with
+    one ``sys.stdout.write`` rather than a ``print`` per row.
+    """
+    lines: list[str] = []
+    total = done = deferred = 0
     total_cost = 0.0
     for r in rows:
+        if not total:
+            lines.append(f"Acceptance criteria for task #{task_id}: {task_summary}")
+            lines.append(f"{'ID':<6} {'Done':<6} {'Type':<8} {'Source':<14} {'Cost':<10} {'Commit':<10} {'Committed At':<22} {'Criterion'}")
+            lines.append("-" * 122)
+        total += 1
         if r["is_completed"]:
             marker = "[x]"
+            done += 1
         elif r["is_deferred"]:
             marker = "[~]"
+            deferred += 1
         else:
             marker = "[ ]"
         cost_str = f"${r['cost_dollars']:.4f}" if r["cost_dollars"] else ""
@@ -670,17 +796,36 @@ def cmd_list(args: argparse.Namespace, db_path: str, config: dict) -> int:
             criterion_text += f" [deferred: {r['deferred_reason']}]"
         if r["is_completed"] and r["skip_note"]:
             criterion_text += f" [skip: {r['skip_note']}]"
-        print(f"{r['id']:<6} {marker:<6} {ctype:<8} {r['source']:<14} {cost_str:<10} {commit_str:<10} {committed_str:<22} {criterion_text}")
+        lines.append(f"{r['id']:<6} {marker:<6} {ctype:<8} {r['source']:<14} {cost_str:<10} {commit_str:<10} {committed_str:<22} {criterion_text}")
 
-    done = sum(1 for r in rows if r["is_completed"])
-    deferred = sum(1 for r in rows if r["is_deferred"] and not r["is_completed"])
-    summary = f"\nProgress: {done}/{len(rows)}"
+    if not total:
+        print(f"No acceptance criteria for task #{task_id}: {task_summary}")
+        return
+
+    summary = f"\nProgress: {done}/{total}"
     if deferred:
         summary += f"  |  Deferred: {deferred}"
     if total_cost > 0:
         summary += f"  |  Total cost: ${total_cost:.4f}"
-    print(summary)
-    return 0
+    lines.append(summary)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def cmd_list(args: argparse.Namespace, db_path: str, config: dict) -> int:
+    with contextlib.closing(get_connection(db_path)) as conn:
+        cur = conn.execute(_SQL_LIST_CRITERIA, (args.task_id,))
+        first = cur.fetchone()
+        if first is None:
+            print(f"Error: Task {args.task_id} not found", file=sys.stderr)
+            return 2
+
+        rows = itertools.chain((first,), cur) if first["id"] is not None else ()
+        if not pretty_requested():
+            print(dumps([{col: r[col] for col in _LIST_CRITERIA_COLUMNS} for r in rows]))
+            return 0
+
+        _print_criteria_table(args.task_id, first["task_summary"], rows)
+        return 0
 
 
 def _normalize_update_spec(raw: str | None) -> tuple[bool, str | None]:
@@ -716,8 +861,7 @@ def cmd_update(args: argparse.Namespace, db_path: str, config: dict) -> int:
         )
         return 2
 
-    conn = get_connection(db_path)
-    try:
+    with contextlib.closing(get_connection(db_path)) as conn:
         row = conn.execute(
             "SELECT id, task_id, criterion, criterion_type, verification_spec "
             "FROM acceptance_criteria WHERE id = ?",
@@ -760,8 +904,6 @@ def cmd_update(args: argparse.Namespace, db_path: str, config: dict) -> int:
             "verification_spec": new_spec,
         }))
         return 0
-    finally:
-        conn.close()
 
 
 def _done_single(conn: sqlite3.Connection, criterion_id: int, skip_verify: bool,
@@ -769,12 +911,7 @@ def _done_single(conn: sqlite3.Connection, criterion_id: int, skip_verify: bool,
                   committed_at: Optional[str], note: Optional[str] = None,
                   head_task_id: Optional[int] = None) -> int:
     """Mark a single criterion as done. Returns 0 on success, 1 on verification failure, 2 on not-found."""
-    row = conn.execute(
-        "SELECT id, task_id, criterion, is_completed, criterion_type, verification_spec, "
-        "is_deferred, deferred_reason, commit_hash, committed_at "
-        "FROM acceptance_criteria WHERE id = ?",
-        (criterion_id,),
-    ).fetchone()
+    row = conn.execute(_SQL_GET_CRITERION_FOR_DONE, (criterion_id,)).fetchone()
     if not row:
         print(f"Error: Criterion {criterion_id} not found", file=sys.stderr)
         return 2
@@ -792,8 +929,8 @@ def _done_single(conn: sqlite3.Connection, criterion_id: int, skip_verify: bool,
         if commit_hash is not None and commit_hash != row["commit_hash"]:
             conn.execute(
                 "UPDATE acceptance_criteria SET commit_hash = ?, committed_at = ?, "
-                "updated_at = datetime('now') WHERE id = ?",
-                (commit_hash, committed_at, criterion_id),
+                "updated_at = ? WHERE id = ?",
+                (commit_hash, committed_at, _utc_now_sql(), criterion_id),
             )
             conn.commit()
             refreshed = True
@@ -825,8 +962,8 @@ def _done_single(conn: sqlite3.Connection, criterion_id: int, skip_verify: bool,
             # Store the failed result
             conn.execute(
                 "UPDATE acceptance_criteria SET verification_result = ?, "
-                "updated_at = datetime('now') WHERE id = ?",
-                (verification_result, criterion_id),
+                "updated_at = ? WHERE id = ?",
+                (verification_result, _utc_now_sql(), criterion_id),
             )
             conn.commit()
 
@@ -873,16 +1010,33 @@ def _done_single(conn: sqlite3.Connection, criterion_id: int, skip_verify: bool,
     # with completed_at is what distinguishes "verified later" from "never
     # performed" in coverage views and audit queries.
     deferral_cleared = bool(row["is_deferred"])
-    conn.execute(
-        "UPDATE acceptance_criteria SET is_completed = 1, "
-        "completed_at = strftime('%Y-%m-%d %H:%M:%f', 'now'), "
-        "commit_hash = ?, committed_at = ?, "
-        "verification_result = ?, skip_note = ?, "
-        "is_deferred = 0, "
-        "updated_at = datetime('now') WHERE id = ?",
-        (commit_hash, committed_at, verification_result, note, criterion_id),
-    )
+    # The is_completed = 0 guard makes the UPDATE itself the state check: no
+    # row touched means a concurrent `criteria done` completed it after our
+    # SELECT, so report it as such rather than overwriting that run's
+    # completed_at and commit stamp. (Plain UPDATE + rowcount rather than
+    # UPDATE ... RETURNING, which needs SQLite >= 3.35.) updated_at is stamped
+    # here, per criterion, so it stays in step with completed_at even when the
+    # verification specs of earlier criteria in a batch took minutes.
+    marked = conn.execute(
+        _SQL_MARK_DONE,
+        (commit_hash, committed_at, verification_result, note,
+         _utc_now_sql(), criterion_id),
+    ).rowcount
+    # Re-read the stamp either way: on the zero-row path the winner's
+    # commit_hash is what we report, not the stale one from the SELECT above.
+    crit_ts = conn.execute(_SQL_GET_DONE_STAMP, (criterion_id,)).fetchone()
     conn.commit()
+    if not marked:
+        print(dumps({
+            "id": criterion_id,
+            "task_id": row["task_id"],
+            "is_completed": True,
+            "already_completed": True,
+            "criterion": row["criterion"],
+            "commit_hash": crit_ts["commit_hash"] if crit_ts else None,
+            "commit_hash_refreshed": False,
+        }))
+        return 0
     if deferral_cleared:
         reason = row["deferred_reason"] or "no reason recorded"
         print(
@@ -893,13 +1047,9 @@ def _done_single(conn: sqlite3.Connection, criterion_id: int, skip_verify: bool,
         )
 
     # Best-effort cost capture — pass completed_at to bound the transcript window
-    crit_ts = conn.execute(
-        "SELECT completed_at FROM acceptance_criteria WHERE id = ?",
-        (criterion_id,),
-    ).fetchone()
     completed_at_dt = (
         lib.parse_sqlite_timestamp(crit_ts["completed_at"])
-        if crit_ts and crit_ts["completed_at"]
+        if crit_ts["completed_at"]
         else None
     )
     capture_criterion_cost(conn, criterion_id, row["task_id"], completed_at_dt)
@@ -1137,8 +1287,7 @@ def _has_new_commits_over_default() -> bool:
 
 
 def cmd_done(args: argparse.Namespace, db_path: str, config: dict) -> int:
-    conn = get_connection(db_path)
-    try:
+    with contextlib.closing(get_connection(db_path)) as conn:
         # Best-effort: capture current git HEAD short hash and commit timestamp (once for all)
         criterion_ids = args.criterion_ids
         batch_task_id = _single_task_id_for_criteria(conn, criterion_ids)
@@ -1177,13 +1326,10 @@ def cmd_done(args: argparse.Namespace, db_path: str, config: dict) -> int:
             if rc > worst_exit:
                 worst_exit = rc
         return worst_exit
-    finally:
-        conn.close()
 
 
 def cmd_skip(args: argparse.Namespace, db_path: str, config: dict) -> int:
-    conn = get_connection(db_path)
-    try:
+    with contextlib.closing(get_connection(db_path)) as conn:
         row = conn.execute(
             "SELECT id, task_id, criterion, is_completed, is_deferred, deferred_reason "
             "FROM acceptance_criteria WHERE id = ?",
@@ -1216,8 +1362,8 @@ def cmd_skip(args: argparse.Namespace, db_path: str, config: dict) -> int:
 
         conn.execute(
             "UPDATE acceptance_criteria SET is_deferred = 1, deferred_reason = ?, "
-            "updated_at = datetime('now') WHERE id = ?",
-            (args.reason, args.criterion_id),
+            "updated_at = ? WHERE id = ?",
+            (args.reason, _utc_now_sql(), args.criterion_id),
         )
         conn.commit()
         print(dumps({
@@ -1228,23 +1374,32 @@ def cmd_skip(args: argparse.Namespace, db_path: str, config: dict) -> int:
             "criterion": row["criterion"],
         }))
         return 0
-    finally:
-        conn.close()
 
 
 def cmd_reset(args: argparse.Namespace, db_path: str, config: dict) -> int:
-    conn = get_connection(db_path)
-    try:
-        row = conn.execute(
-            "SELECT id, task_id, criterion, is_completed, is_deferred "
-            "FROM acceptance_criteria WHERE id = ?",
-            (args.criterion_id,),
-        ).fetchone()
+    with contextlib.closing(get_connection(db_path)) as conn:
+        # The no-op outcomes ("not found", "already incomplete") stay plain
+        # reads so they never take the write lock; only an actual reset runs
+        # the guarded UPDATE.
+        row = conn.execute(_SQL_GET_CRITERION_FOR_RESET, (args.criterion_id,)).fetchone()
         if not row:
             print(f"Error: Criterion {args.criterion_id} not found", file=sys.stderr)
             return 2
 
-        if not row["is_completed"] and not row["is_deferred"]:
+        reset = False
+        if row["is_completed"] or row["is_deferred"]:
+            # The guard covers a concurrent reset landing between the SELECT
+            # and the UPDATE. (Plain UPDATE + rowcount rather than
+            # UPDATE ... RETURNING, which needs SQLite >= 3.35.)
+            reset = bool(conn.execute(
+                _SQL_MARK_RESET, (_utc_now_sql(), args.criterion_id),
+            ).rowcount)
+            if reset:
+                conn.commit()
+            else:
+                conn.rollback()
+
+        if not reset:
             print(dumps({
                 "id": args.criterion_id,
                 "task_id": row["task_id"],
@@ -1255,15 +1410,6 @@ def cmd_reset(args: argparse.Namespace, db_path: str, config: dict) -> int:
             }))
             return 0
 
-        conn.execute(
-            "UPDATE acceptance_criteria SET is_completed = 0, completed_at = NULL, "
-            "cost_dollars = NULL, tokens_in = NULL, tokens_out = NULL, "
-            "verification_result = NULL, commit_hash = NULL, committed_at = NULL, "
-            "is_deferred = 0, deferred_reason = NULL, skip_note = NULL, "
-            "updated_at = datetime('now') WHERE id = ?",
-            (args.criterion_id,),
-        )
-        conn.commit()
         print(dumps({
             "id": args.criterion_id,
             "task_id": row["task_id"],
@@ -1272,13 +1418,10 @@ def cmd_reset(args: argparse.Namespace, db_path: str, config: dict) -> int:
             "criterion": row["criterion"],
         }))
         return 0
-    finally:
-        conn.close()
 
 
 def cmd_delete(args: argparse.Namespace, db_path: str, config: dict) -> int:
-    conn = get_connection(db_path)
-    try:
+    with contextlib.closing(get_connection(db_path)) as conn:
         row = conn.execute(
             "SELECT id, task_id, criterion, is_completed "
             "FROM acceptance_criteria WHERE id = ?",
@@ -1309,13 +1452,10 @@ def cmd_delete(args: argparse.Namespace, db_path: str, config: dict) -> int:
             "criterion": row["criterion"],
         }))
         return 0
-    finally:
-        conn.close()
 
 
 def cmd_finish_deferred(args: argparse.Namespace, db_path: str, config: dict) -> int:
-    conn = get_connection(db_path)
-    try:
+    with contextlib.closing(get_connection(db_path, row_factory=None)) as conn:
         placeholders = ", ".join("?" for _ in args.task_ids)
         rows = conn.execute(
             f"SELECT id FROM acceptance_criteria "
@@ -1326,36 +1466,34 @@ def cmd_finish_deferred(args: argparse.Namespace, db_path: str, config: dict) ->
         if not rows:
             print(dumps({"marked": 0}))
             return 0
-        ids = [r["id"] for r in rows]
+        ids = [r[0] for r in rows]
         id_placeholders = ", ".join("?" for _ in ids)
+        now = _utc_now_sql()
         # Clear is_deferred to match _done_single (TASK-644 / issue #1058): a
         # completed criterion must not also read as deferred. deferred_reason is
         # kept for history — is_completed=1 with completed_at is what marks it
         # as performed in coverage views and audit queries (issue #1090).
         conn.execute(
             f"UPDATE acceptance_criteria SET is_completed = 1, is_deferred = 0, "
-            f"completed_at = datetime('now'), updated_at = datetime('now') "
+            f"completed_at = ?, updated_at = ? "
             f"WHERE id IN ({id_placeholders})",
-            ids,
+            [now, now] + ids,
         )
         conn.commit()
         print(dumps({"marked": len(ids)}))
         return 0
-    finally:
-        conn.close()
 
 
 # ── CLI ──────────────────────────────────────────────────────────────
 
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: tusk criteria {add|list|update|done|skip|reset|delete|finish-deferred} ...", file=sys.stderr)
-        sys.exit(1)
-
-    db_path = sys.argv[1]
-    config_path = sys.argv[2]
-    config = load_config(config_path)
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the ``tusk criteria`` argument parser once per process.
 
+    Each subparser binds its handler via ``set_defaults(func=...)``; the done
+    subparser also binds itself as ``done_parser`` so main() can report the
+    --note/--skip-verify conflict with the subcommand's own usage line.
+    """
     parser = argparse.ArgumentParser(allow_abbrev=False,
         prog="tusk criteria",
         description="Manage acceptance criteria for tasks",
@@ -1368,7 +1506,7 @@ def main():
     add_p.add_argument("text", help="Criterion text")
     add_p.add_argument(
         "--source", default="original",
-        choices=["original", "subsumption", "pr_review"],
+        choices=CRITERION_SOURCES,
         help="Source of the criterion (default: original)",
     )
     add_p.add_argument(
@@ -1383,10 +1521,24 @@ def main():
             "verification passes when no file matches (absence assertion)"
         ),
     )
+    add_p.set_defaults(func=cmd_add)
+
+    # add-many
+    add_many_p = subparsers.add_parser(
+        "add-many", allow_abbrev=False,
+        help="Add manual criteria to a task in one transaction from criterion<TAB>source lines",
+    )
+    add_many_p.add_argument("task_id", type=int, help="Task ID")
+    add_many_p.add_argument(
+        "--file",
+        help="Read criterion<TAB>source lines from this file (default: stdin; source defaults to original)",
+    )
+    add_many_p.set_defaults(func=cmd_add_many)
 
     # list
     list_p = subparsers.add_parser("list", allow_abbrev=False, help="List criteria for a task")
     list_p.add_argument("task_id", type=int, help="Task ID")
+    list_p.set_defaults(func=cmd_list)
 
     # update
     update_p = subparsers.add_parser("update", allow_abbrev=False, help="Update criterion text, type, or verification spec")
@@ -1405,6 +1557,7 @@ def main():
         "--verification-spec",
         help="New verification spec, or literal NULL to clear it",
     )
+    update_p.set_defaults(func=cmd_update)
 
     # done
     done_p = subparsers.add_parser("done", allow_abbrev=False, help="Mark one or more criteria as completed")
@@ -1425,6 +1578,7 @@ def main():
         "--note",
         help="Rationale to attach to the criterion (requires --skip-verify)",
     )
+    done_p.set_defaults(func=cmd_done, done_parser=done_p)
 
     # skip
     skip_p = subparsers.add_parser(
@@ -1442,10 +1596,12 @@ def main():
             "commit hash. Also used by chain orchestrators with reason='chain'."
         ),
     )
+    skip_p.set_defaults(func=cmd_skip)
 
     # reset
     reset_p = subparsers.add_parser("reset", allow_abbrev=False, help="Reset a criterion to incomplete (clears deferred flag too)")
     reset_p.add_argument("criterion_id", type=int, help="Criterion ID")
+    reset_p.set_defaults(func=cmd_reset)
 
     # delete
     delete_p = subparsers.add_parser("delete", allow_abbrev=False, help="Delete a stale criterion")
@@ -1454,6 +1610,7 @@ def main():
         "--force", action="store_true",
         help="Allow deleting a completed criterion",
     )
+    delete_p.set_defaults(func=cmd_delete)
 
     # finish-deferred
     fd_p = subparsers.add_parser(
@@ -1462,7 +1619,21 @@ def main():
     )
     fd_p.add_argument("--reason", required=True, help="Deferred reason to match (e.g., 'chain')")
     fd_p.add_argument("task_ids", type=int, nargs="+", help="One or more task IDs")
+    fd_p.set_defaults(func=cmd_finish_deferred)
+
+    return parser
+
 
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: tusk criteria {add|add-many|list|update|done|skip|reset|delete|finish-deferred} ...", file=sys.stderr)
+        sys.exit(1)
+
+    db_path = sys.argv[1]
+    config_path = sys.argv[2]
+    config = load_config(config_path)
+
+    parser = _build_parser()
     args = parser.parse_args(sys.argv[3:])
 
     if not args.command:
@@ -1470,25 +1641,19 @@ def main():
         sys.exit(1)
 
     if args.command == "done" and getattr(args, "note", None) and not args.skip_verify:
-        done_p.error("--note requires --skip-verify")
+        args.done_parser.error("--note requires --skip-verify")
 
     # Catch-all so transient DB contention or another unexpected failure leaves
     # command-specific stderr. Without this, the outer bin/tusk silent-exit guard
     # can only report a generic "criteria: exited N with no diagnostic output".
     try:
-        handlers = {
-            "add": cmd_add, "list": cmd_list, "done": cmd_done,
-            "update": cmd_update,
-            "skip": cmd_skip, "reset": cmd_reset,
-            "delete": cmd_delete,
-            "finish-deferred": cmd_finish_deferred,
-        }
+        # Each subparser binds its handler via set_defaults(func=...).
         # retry_on_locked re-runs the whole handler (each opens/commits/closes its
         # own connection) on transient "database is locked" contention so parallel
         # worktree sessions don't hard-fail a criteria write (issue #1143). On
         # budget exhaustion it re-raises OperationalError into the catch-all below.
         sys.exit(_db_lib.retry_on_locked(
-            lambda: handlers[args.command](args, db_path, config),
+            lambda: args.func(args, db_path, config),
             label=f"criteria {args.command}",
         ))
     except Exception as e:
@@ -25,6 +25,20 @@ log = logging.getLogger(__name__)
 _db_lib = tusk_loader.load("tusk-db-lib")
 get_connection = _db_lib.get_connection
 
+# Low-cardinality task columns (config enums); interned at fetch time so every
+# row shares one str object per value instead of one per row.
+_TASK_ENUM_FIELDS = ("status", "priority", "complexity", "domain", "task_type")
+
+
+def _intern_enum_fields(rows: list[dict], fields: tuple[str, ...] = _TASK_ENUM_FIELDS) -> None:
+    """Replace each str value of ``fields`` in ``rows`` with its interned copy, in place."""
+    intern = sys.intern
+    for d in rows:
+        for f in fields:
+            v = d.get(f)
+            if type(v) is str:
+                d[f] = intern(v)
+
 
 def fetch_task_metrics(conn: sqlite3.Connection) -> list[dict]:
     """Fetch per-task token and cost metrics from task_metrics view.
@@ -91,6 +105,7 @@ def fetch_task_metrics(conn: sqlite3.Connection) -> list[dict]:
            ORDER BY tm.total_cost DESC, tm.id ASC"""
     ).fetchall()
     result = [dict(r) for r in rows]
+    _intern_enum_fields(result)
     log.debug("Fetched %d task metrics rows", len(result))
     return result
 
@@ -157,6 +172,8 @@ def fetch_task_dependencies(conn: sqlite3.Connection) -> dict[int, dict]:
         tid = r["task_id"]
         dep_id = r["depends_on_id"]
         rel = r["relationship_type"]
+        if rel is not None:
+            rel = sys.intern(rel)
         result.setdefault(tid, {"blocked_by": [], "blocks": []})
         result[tid]["blocked_by"].append({"id": dep_id, "type": rel})
         result.setdefault(dep_id, {"blocked_by": [], "blocks": []})
@@ -193,6 +210,7 @@ def fetch_dag_tasks(conn: sqlite3.Connection) -> list[dict]:
            ORDER BY tm.id ASC"""
     ).fetchall()
     result = [dict(r) for r in rows]
+    _intern_enum_fields(result)
     log.debug("Fetched %d DAG tasks", len(result))
     return result
 
@@ -6,13 +6,19 @@ section builders. Imported by tusk-dashboard.py via importlib.
 Not a standalone CLI command — imported by tusk-dashboard.py via tusk_loader.
 """
 
+import bisect
+import functools
 import html
+import io
 import json
 import logging
 import os
 import sys
-from collections import defaultdict, deque
-from datetime import datetime, timedelta, timezone
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from itertools import groupby
+from operator import itemgetter
+from types import MappingProxyType
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import tusk_loader  # loads tusk-dashboard-css.py and tusk-dashboard-js.py
@@ -20,34 +26,72 @@ import tusk_loader  # loads tusk-dashboard-css.py and tusk-dashboard-js.py
 log = logging.getLogger(__name__)
 
 
-# Expected session ranges per complexity tier (from CLAUDE.md)
-EXPECTED_SESSIONS = {
-    'XS': (0.5, 1),
-    'S': (1, 1.5),
-    'M': (1, 2),
-    'L': (3, 5),
-    'XL': (5, 10),
-}
+# Complexity tiers in ascending order; COMPLEXITY_ORD maps a tier to its index
+# into the per-tier tuples below.
+COMPLEXITY_TIERS = ('XS', 'S', 'M', 'L', 'XL')
+COMPLEXITY_ORD = MappingProxyType({tier: i for i, tier in enumerate(COMPLEXITY_TIERS)})
 
-COMPLEXITY_SORT_ORDER = {'XS': 1, 'S': 2, 'M': 3, 'L': 4, 'XL': 5}
+# Expected session ranges per complexity tier (from CLAUDE.md), by ordinal
+_EXPECTED_SESSIONS_BY_ORD = ((0.5, 1), (1, 1.5), (1, 2), (3, 5), (5, 10))
+# Client-side sort key per complexity tier, by ordinal (unknown tiers sort as 0)
+_COMPLEXITY_SORT_KEY_BY_ORD = (1, 2, 3, 4, 5)
+
+# Shared stand-in for "no items" lookups so misses don't allocate a list.
+_EMPTY_TUPLE = ()
+
+# Status badge CSS class per task status (the status-* rules in
+# tusk-dashboard-css.py); statuses outside this set are slugged on the fly.
+_STATUS_CSS = {s: f"status-{s.lower().replace(' ', '-')}" for s in ("To Do", "In Progress", "Done")}
 
 
 # ---------------------------------------------------------------------------
 # Formatting helpers
 # ---------------------------------------------------------------------------
 
-def esc(text) -> str:
-    """HTML-escape a value, handling None."""
+def _script_json(obj) -> str:
+    """Serialize obj for embedding in an inline <script> block.
+
+    Compact separators and raw UTF-8 (no \\uXXXX escapes) keep the payloads
+    small; "</" is escaped so a value can never close the surrounding script
+    tag.
+    """
+    text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.replace("</", "<\\/")
+
+
+def esc(text, _escape=html.escape) -> str:
+    """HTML-escape a value, handling None.
+
+    Plain strings with none of the five special characters are returned as-is;
+    that is the common case for summaries and names and skips html.escape.
+    """
     if text is None:
         return ""
-    return html.escape(str(text))
+    if type(text) is str:
+        if '&' in text or '<' in text or '>' in text or '"' in text or "'" in text:
+            return _escape(text)
+        return text
+    return _escape(str(text))
+
+
+# str() of 0..999, which format_number and format_tokens_compact return
+# verbatim (no comma or K/M suffix); indexing beats formatting per cell.
+_SMALL_INT_STRS = tuple(str(i) for i in range(1000))
+
+
+# esc() for low-cardinality values (status, complexity, domain, task type, model
+# list, dependency type) that repeat on every row; free-text fields use esc().
+_esc_enum = functools.lru_cache(maxsize=256)(esc)
 
 
 def format_number(n) -> str:
     """Format a number with commas."""
     if n is None:
         return "0"
-    return f"{int(n):,}"
+    n = int(n)
+    if 0 <= n < 1000:
+        return _SMALL_INT_STRS[n]
+    return f"{n:,}"
 
 
 def format_cost(c) -> str:
@@ -82,10 +126,27 @@ def format_status_duration(seconds) -> str:
     return f"{minutes}m"
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_dt(dt_str: str) -> datetime | None:
-    """Parse a datetime string (assumed UTC) and return a UTC-aware datetime."""
-    if not dt_str:
+    """Parse a datetime string (assumed UTC) and return a UTC-aware datetime.
+
+    Memoized: skill runs and sessions share many identical timestamps, and
+    parsing is the slowest step of every date cell.
+    """
+    # Anything shorter than "YYYY-MM-DD HH:MM:SS" cannot be a full timestamp;
+    # reject it before paying for a parse attempt and its ValueError.
+    if not dt_str or len(dt_str) < 19:
         return None
+    # fromisoformat is C-implemented, but from Python 3.11 on it also accepts
+    # 'T', 'Z' and UTC offsets. Take it only for SQLite's exact
+    # "YYYY-MM-DD HH:MM:SS" shape, so every version parses the same strings
+    # the strptime formats below do.
+    if (len(dt_str) == 19 and dt_str[10] == " " and dt_str[4] == "-"
+            and dt_str[7] == "-" and dt_str[13] == ":" and dt_str[16] == ":"):
+        try:
+            return datetime.fromisoformat(dt_str).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
     for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
         try:
             return datetime.strptime(dt_str, fmt).replace(tzinfo=timezone.utc)
@@ -94,6 +155,7 @@ def _parse_dt(dt_str: str) -> datetime | None:
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date(dt_str) -> str:
     """Format an ISO datetime string as YYYY-MM-DD HH:MM:SS in local timezone."""
     if dt_str is None:
@@ -115,6 +177,8 @@ def format_tokens_compact(n) -> str:
         return f"{n / 1_000_000:.1f}M"
     if n >= 1_000:
         return f"{n / 1_000:.1f}K"
+    if n >= 0:
+        return _SMALL_INT_STRS[int(n)]
     return str(int(n))
 
 
@@ -174,22 +238,19 @@ def format_ctx_pct(pct, color: bool = False) -> str:
     return f'<span style="{style}">{label}</span>'
 
 
+# Lower bounds (as a fraction of max cost) of heat tiers 1-5; below 0.10 is untinted.
+_HEAT_THRESHOLDS = (0.10, 0.25, 0.45, 0.65, 0.85)
+_HEAT_CLASSES = ("", "cost-heat-1", "cost-heat-2", "cost-heat-3", "cost-heat-4", "cost-heat-5")
+# Full class attribute for the task-table cost cell, keyed by heat class
+_COST_CELL_CLASS = {c: f"col-cost {c}".strip() for c in _HEAT_CLASSES}
+
+
 def cost_heat_class(cost: float, max_cost: float) -> str:
     """Return a CSS class for cost heatmap tinting."""
     if max_cost <= 0 or cost <= 0:
         return ""
-    ratio = cost / max_cost
-    if ratio < 0.10:
-        return ""
-    if ratio < 0.25:
-        return "cost-heat-1"
-    if ratio < 0.45:
-        return "cost-heat-2"
-    if ratio < 0.65:
-        return "cost-heat-3"
-    if ratio < 0.85:
-        return "cost-heat-4"
-    return "cost-heat-5"
+    # bisect_right: a ratio equal to a threshold belongs to the tier above it.
+    return _HEAT_CLASSES[bisect.bisect_right(_HEAT_THRESHOLDS, cost / max_cost)]
 
 
 # ---------------------------------------------------------------------------
@@ -220,32 +281,38 @@ def filter_dag_nodes(tasks: list[dict], edges: list[dict], blockers: list[dict],
     visible_ids = {t["id"] for t in visible_tasks}
 
     if not show_all:
-        adj: dict[int, set] = defaultdict(set)
+        # Union-Find over the visible subgraph: one pass over edges merges
+        # components, then a component is pruned when none of its members is
+        # still open. No adjacency map, BFS queue, or visited set needed.
+        # Task ids are mapped to dense indices once so find/union work on
+        # plain lists rather than hashing ids on every step.
+        index = {tid: i for i, tid in enumerate(visible_ids)}
+        parent = list(range(len(index)))
+        size = [1] * len(index)
+
+        def find(x: int) -> int:
+            root = x
+            while parent[root] != root:
+                root = parent[root]
+            while parent[x] != root:
+                parent[x], x = root, parent[x]
+            return root
+
         for e in edges:
-            a, b = e["task_id"], e["depends_on_id"]
-            if a in visible_ids and b in visible_ids:
-                adj[a].add(b)
-                adj[b].add(a)
-
-        status_map = {t["id"]: t["status"] for t in visible_tasks}
-        visited: set[int] = set()
-        remove_ids: set[int] = set()
-        for tid in visible_ids:
-            if tid in visited:
+            a = index.get(e["task_id"])
+            b = index.get(e["depends_on_id"])
+            if a is None or b is None:
+                continue
+            ra, rb = find(a), find(b)
+            if ra == rb:
                 continue
-            queue = deque([tid])
-            component: list[int] = []
-            while queue:
-                node = queue.popleft()
-                if node in visited:
-                    continue
-                visited.add(node)
-                component.append(node)
-                for neighbor in adj[node]:
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-            if all(status_map[n] == "Done" for n in component):
-                remove_ids.update(component)
+            if size[ra] < size[rb]:
+                ra, rb = rb, ra
+            parent[rb] = ra
+            size[ra] += size[rb]
+
+        open_roots = {find(index[t["id"]]) for t in visible_tasks if t["status"] != "Done"}
+        remove_ids = {tid for tid, i in index.items() if find(i) not in open_roots}
 
         if remove_ids:
             visible_tasks = [t for t in visible_tasks if t["id"] not in remove_ids]
@@ -262,88 +329,176 @@ def filter_dag_nodes(tasks: list[dict], edges: list[dict], blockers: list[dict],
     return visible_tasks, visible_edges, visible_blockers
 
 
+# Mermaid labels are double-quoted, so embedded double quotes become single.
+_MERMAID_LABEL_TRANS = str.maketrans('"', "'")
+
+
+# Node shape by complexity: XS/S boxes, M rounded, L/XL (and anything else) hexagons.
+_MERMAID_NODE_SHAPE = {"XS": ('["', '"]'), "S": ('["', '"]'), "M": ('("', '")')}
+_MERMAID_NODE_SHAPE_DEFAULT = ('{{"', '"}}')
+_MERMAID_STATUS_CLASS = {"To Do": "todo", "In Progress": "inprogress", "Done": "done"}
+
+
 def build_mermaid(tasks: list[dict], edges: list[dict], blockers: list[dict]) -> str:
     """Build Mermaid graph definition from tasks, edges, and blockers."""
-    lines = ["graph LR"]
-
-    lines.append('    classDef todo fill:#3b82f6,stroke:#2563eb,color:#fff')
-    lines.append('    classDef inprogress fill:#f59e0b,stroke:#d97706,color:#fff')
-    lines.append('    classDef done fill:#22c55e,stroke:#16a34a,color:#fff')
-    lines.append('    classDef blocker fill:#ef4444,stroke:#dc2626,color:#fff')
-    lines.append('    classDef blockerResolved fill:#9ca3af,stroke:#6b7280,color:#fff')
+    lines = [
+        "graph LR",
+        '    classDef todo fill:#3b82f6,stroke:#2563eb,color:#fff',
+        '    classDef inprogress fill:#f59e0b,stroke:#d97706,color:#fff',
+        '    classDef done fill:#22c55e,stroke:#16a34a,color:#fff',
+        '    classDef blocker fill:#ef4444,stroke:#dc2626,color:#fff',
+        '    classDef blockerResolved fill:#9ca3af,stroke:#6b7280,color:#fff',
+    ]
 
     for t in tasks:
-        node_id = "T" + str(t["id"])
+        tid = t["id"]
         summary = t["summary"] or ""
         if len(summary) > 40:
             summary = summary[:37] + "..."
-        summary = summary.replace('"', "'")
-        label = "#" + str(t["id"]) + ": " + summary
-        complexity = t["complexity"] or "S"
-
-        if complexity in ("XS", "S"):
-            node_def = node_id + '["' + label + '"]'
-        elif complexity == "M":
-            node_def = node_id + '("' + label + '")'
-        else:
-            node_def = node_id + '{{"' + label + '"}}'
-
-        lines.append("    " + node_def)
-
-        status = t["status"]
-        if status == "To Do":
-            lines.append("    class " + node_id + " todo")
-        elif status == "In Progress":
-            lines.append("    class " + node_id + " inprogress")
-        elif status == "Done":
-            lines.append("    class " + node_id + " done")
+        summary = summary.translate(_MERMAID_LABEL_TRANS)
+        open_, close_ = _MERMAID_NODE_SHAPE.get(t["complexity"] or "S", _MERMAID_NODE_SHAPE_DEFAULT)
+        lines.append(f'    T{tid}{open_}#{tid}: {summary}{close_}')
+        cls = _MERMAID_STATUS_CLASS.get(t["status"])
+        if cls:
+            lines.append(f"    class T{tid} {cls}")
 
     for b in blockers:
-        node_id = "B" + str(b["id"])
+        bid = b["id"]
         desc = b["description"] or ""
         if len(desc) > 35:
             desc = desc[:32] + "..."
-        desc = desc.replace('"', "'")
+        desc = desc.translate(_MERMAID_LABEL_TRANS)
         btype = b["blocker_type"] or "external"
-        label = btype + ": " + desc
-        node_def = node_id + '>"' + label + '"]'
-        lines.append("    " + node_def)
+        cls = "blockerResolved" if b["is_resolved"] else "blocker"
+        lines.extend((
+            f'    B{bid}>"{btype}: {desc}"]',
+            f"    class B{bid} {cls}",
+        ))
+
+    lines.extend(
+        f'    T{e["depends_on_id"]} {"-.->" if e["relationship_type"] == "contingent" else "-->"} T{e["task_id"]}'
+        for e in edges
+    )
+    lines.extend(f'    B{b["id"]} -.-x T{b["task_id"]}' for b in blockers)
+    lines.extend(f"    click T{t['id']} dagShowSidebar" for t in tasks)
+    lines.extend(f"    click B{b['id']} dagShowBlockerSidebar" for b in blockers)
 
-        if b["is_resolved"]:
-            lines.append("    class " + node_id + " blockerResolved")
-        else:
-            lines.append("    class " + node_id + " blocker")
+    return "\n".join(lines)
 
-    for e in edges:
-        src = "T" + str(e["depends_on_id"])
-        dst = "T" + str(e["task_id"])
-        if e["relationship_type"] == "contingent":
-            lines.append("    " + src + " -.-> " + dst)
-        else:
-            lines.append("    " + src + " --> " + dst)
 
-    for b in blockers:
-        src = "B" + str(b["id"])
-        dst = "T" + str(b["task_id"])
-        lines.append("    " + src + " -.-x " + dst)
+# ---------------------------------------------------------------------------
+# Static HTML fragments (identical on every render)
+# ---------------------------------------------------------------------------
 
-    for t in tasks:
-        node_id = "T" + str(t["id"])
-        lines.append('    click ' + node_id + ' dagShowSidebar')
+_CRITERIA_SORT_BAR_HTML = (
+    '<div class="criteria-sort-bar">'
+    '<span class="criteria-sort-label">Sort:</span>'
+    '<button class="criteria-sort-btn" data-sort-key="completed">Completed <span class="sort-arrow">&#9650;</span></button>'
+    '<button class="criteria-sort-btn" data-sort-key="cost">Cost <span class="sort-arrow">&#9650;</span></button>'
+    '<button class="criteria-sort-btn" data-sort-key="commit">Commit <span class="sort-arrow">&#9650;</span></button>'
+    '</div>'
+)
 
-    for b in blockers:
-        node_id = "B" + str(b["id"])
-        lines.append('    click ' + node_id + ' dagShowBlockerSidebar')
+_TABLE_HEADER_HTML = """\
+<thead>
+  <tr>
+    <th data-col="0" data-type="num">ID <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="1" data-type="str">Task <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="2" data-type="num" style="text-align:right" class="sort-desc">Cost <span class="sort-arrow">\u25BC</span></th>
+    <th data-col="3" data-type="str">Status <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="4" data-type="num" style="text-align:right" title="For Done tasks: wall-clock span from first session start to last session end (includes gaps between sessions). For active tasks: time elapsed since first started (In Progress) or created (To Do).">Duration <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="5" data-type="num">Size <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="6" data-type="num" style="text-align:right">WSJF <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="7" data-type="str">Model <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="8" data-type="num" style="text-align:right">Work Time <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="9" data-type="num" style="text-align:right">Lines <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="10" data-type="num" style="text-align:right">Tokens In <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="11" data-type="num" style="text-align:right">Tokens Out <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="12" data-type="num" style="text-align:right" title="Context window % at the start of the earliest session">Ctx% Start <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="13" data-type="num" style="text-align:right" title="Peak context window % reached across all sessions">Ctx% Peak <span class="sort-arrow">\u25B2</span></th>
+    <th data-col="14" data-type="num" style="text-align:right" title="Context window % at the end of the latest session">Ctx% End <span class="sort-arrow">\u25B2</span></th>
+  </tr>
+</thead>"""
 
-    return "\n".join(lines)
+_MUTED_DASH_HTML = '<span class="text-muted-dash">&mdash;</span>'
+_EXPAND_ICON_HTML = '<span class="expand-icon">&#9654;</span> '
+_SUMMARY_OPEN_HTML = '<div class="summary-text">'
+_SUMMARY_CLOSE_HTML = '</div>'
+
+# Task table row, filled positionally by generate_task_row_to with %-formatting;
+# every value is pre-escaped/pre-formatted by the caller.
+_TASK_ROW_FMT = """\
+<tr%s data-status="%s" data-summary="%s" data-task-id="%s" data-complexity="%s" data-type="%s">
+  <td class="col-id" data-sort="%s">%s#%s</td>
+  <td class="col-summary">%s</td>
+  <td class="%s" data-sort="%s">%s</td>
+  <td class="col-status"><span class="status-badge %s">%s</span></td>
+  <td class="col-status-duration" data-sort="%s" style="text-align:right">%s</td>
+  <td class="col-complexity" data-sort="%s">%s</td>
+  <td class="col-wsjf" data-sort="%s">%s</td>
+  <td class="col-model" data-sort="%s" title="%s">%s</td>
+  <td class="col-duration" data-sort="%s" title="wall: %s · active (idle-discounted): %s">%s</td>
+  <td class="col-lines" data-sort="%s" data-lines-added="%s" data-lines-removed="%s">%s</td>
+  <td class="col-tokens-in" data-sort="%s">%s</td>
+  <td class="col-tokens-out" data-sort="%s">%s</td>
+  <td class="col-ctx-start" data-sort="%s" style="text-align:right">%s</td>
+  <td class="col-ctx-peak" data-sort="%s" style="text-align:right">%s</td>
+  <td class="col-ctx-end" data-sort="%s" style="text-align:right">%s</td>
+</tr>
+"""
+
+_PAGINATION_HTML = """\
+<div class="pagination-bar" id="paginationBar">
+  <span class="page-info" id="pageInfo"></span>
+  <div class="pagination-controls">
+    <label>Per page:
+      <select class="page-size-select" id="pageSize">
+        <option value="10">10</option>
+        <option value="25">25</option>
+        <option value="50">50</option>
+        <option value="0">All</option>
+      </select>
+    </label>
+    <button class="page-btn" id="prevPage">\u2190 Prev</button>
+    <button class="page-btn" id="nextPage">Next \u2192</button>
+  </div>
+</div>"""
+
+_DAG_LEGEND_HTML = """\
+    <div class="dag-legend">
+      <div class="dag-legend-title">Legend</div>
+      <div class="dag-legend-row">
+        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#3b82f6"></span> To Do</span>
+        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#f59e0b"></span> In Progress</span>
+        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#22c55e"></span> Done</span>
+        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#ef4444"></span> Blocker</span>
+        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#9ca3af"></span> Resolved</span>
+      </div>
+      <div class="dag-legend-row">
+        <span class="dag-legend-item">[rect] = XS/S</span>
+        <span class="dag-legend-item">(rounded) = M</span>
+        <span class="dag-legend-item">&#x2B21; hexagon = L/XL</span>
+        <span class="dag-legend-item">&#x25B7; flag = blocker</span>
+      </div>
+      <div class="dag-legend-row">
+        <span class="dag-legend-item">&mdash;&mdash;&gt; blocks</span>
+        <span class="dag-legend-item">- - -&gt; contingent</span>
+        <span class="dag-legend-item">-&middot;-x blocker</span>
+      </div>
+    </div>"""
 
 
 # ---------------------------------------------------------------------------
 # HTML section generators
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def generate_css() -> str:
-    """Generate the full CSS wrapped in a <style> block."""
+    """Generate the full CSS wrapped in a <style> block.
+
+    Memoized: the CSS module is loaded once per process, so the rendered
+    block is immutable and repeat renders reuse it.
+    """
     return '<style>\n' + tusk_loader.load("tusk-dashboard-css").CSS + '\n</style>'
 
 
@@ -420,11 +575,11 @@ def _generate_tool_stats_panel(tool_stats: list[dict]) -> str:
     if not tool_stats:
         return ""
     task_total = sum(r["total_cost"] or 0 for r in tool_stats)
-    tool_rows = ""
+    tool_rows = []
     for r in tool_stats:
         tool_cost = r["total_cost"] or 0
         tool_pct = (tool_cost / task_total * 100) if task_total > 0 else 0
-        tool_rows += (
+        tool_rows.append(
             f'<tr class="tc-row">'
             f'<td class="tc-tool">{esc(r["tool_name"])}</td>'
             f'<td class="tc-calls" style="text-align:right;font-variant-numeric:tabular-nums;">{int(r["call_count"] or 0):,}</td>'
@@ -455,7 +610,7 @@ def _generate_tool_stats_panel(tool_stats: list[dict]) -> str:
         f'<th style="text-align:right">Cost</th>'
         f'<th>Share of attributed cost</th>'
         f'</tr></thead>'
-        f'<tbody>{tool_rows}</tbody>'
+        f'<tbody>{"".join(tool_rows)}</tbody>'
         f'</table>'
         f'</div>'
         f'</details>'
@@ -504,17 +659,36 @@ def generate_skill_run_costs_section(skill_runs: list[dict]) -> str:
 </div>"""
 
 
+_COST_CELL_STYLE_BASE = "text-align:right;font-variant-numeric:tabular-nums;"
+_COST_CELL_STYLE_HIGH = _COST_CELL_STYLE_BASE + "background-color:#fecaca;color:#7f1d1d;"
+_COST_CELL_STYLE_MID = _COST_CELL_STYLE_BASE + "background-color:#fed7aa;color:#7c2d12;"
+_COST_CELL_STYLE_LOW = _COST_CELL_STYLE_BASE + "background-color:#dcfce7;color:#14532d;"
+
+
 def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict = None) -> str:
     """Generate the All Runs table panel for the Skills tab."""
+    buf = io.StringIO()
+    generate_skill_runs_section_to(buf, skill_runs, tool_stats_by_run)
+    return buf.getvalue()
+
+
+def generate_skill_runs_section_to(out, skill_runs: list[dict], tool_stats_by_run: dict = None) -> None:
+    """Write the All Runs table panel to ``out`` (any object with ``write``).
+
+    Rows and tool panels are written as they are built, so a dashboard with
+    hundreds of runs never materializes the table body as one large string.
+    """
     if tool_stats_by_run is None:
         tool_stats_by_run = {}
     if not skill_runs:
-        return """\
+        out.write("""\
 <div class="panel" style="margin-bottom: var(--sp-6);">
   <div class="section-header">All Runs</div>
   <p class="empty" style="padding: var(--sp-4);">No skill runs recorded yet.</p>
-</div>"""
+</div>""")
+        return
 
+    runs_with_tools = {run_id for run_id, stats in tool_stats_by_run.items() if stats}
     total_runs = len(skill_runs)
     top3_ids = (
         {r['id'] for r in sorted(skill_runs, key=lambda x: x.get('cost_dollars') or 0, reverse=True)[:3]}
@@ -524,21 +698,40 @@ def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict
     all_costs = [r.get('cost_dollars') or 0 for r in skill_runs]
     max_cost = max(all_costs) if all_costs else 0
 
+    # max_cost is loop-invariant: compare each cost against absolute tier
+    # thresholds instead of dividing per row.
+    t80, t50, t20 = 0.8 * max_cost, 0.5 * max_cost, 0.2 * max_cost
+
     def cost_cell_style(cost: float) -> str:
         if max_cost <= 0 or cost <= 0:
-            return "text-align:right;font-variant-numeric:tabular-nums;"
-        ratio = cost / max_cost
-        if ratio >= 0.8:
-            bg = "background-color:#fecaca;color:#7f1d1d;"
-        elif ratio >= 0.5:
-            bg = "background-color:#fed7aa;color:#7c2d12;"
-        elif ratio >= 0.2:
-            bg = "background-color:#dcfce7;color:#14532d;"
-        else:
-            bg = ""
-        return f"text-align:right;font-variant-numeric:tabular-nums;{bg}"
-
-    table_rows = ""
+            return _COST_CELL_STYLE_BASE
+        if cost >= t80:
+            return _COST_CELL_STYLE_HIGH
+        if cost >= t50:
+            return _COST_CELL_STYLE_MID
+        if cost >= t20:
+            return _COST_CELL_STYLE_LOW
+        return _COST_CELL_STYLE_BASE
+
+    out.write("""\
+<div class="panel" style="margin-bottom: var(--sp-6);">
+  <div class="section-header">All Runs</div>
+  <div class="dash-table-scroll">
+    <table>
+      <thead>
+        <tr>
+          <th>ID</th>
+          <th>Skill</th>
+          <th>Date</th>
+          <th style="text-align:right">Cost</th>
+          <th style="text-align:right">Tokens In</th>
+          <th style="text-align:right">Tokens Out</th>
+          <th>Duration</th>
+          <th>Model</th>
+        </tr>
+      </thead>
+      <tbody>
+        """)
     for r in skill_runs:
         cost = r.get('cost_dollars') or 0
         cost_str = f"${cost:.4f}"
@@ -564,10 +757,7 @@ def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict
         )
         row_style = ' style="font-weight:600;"' if is_top3 else ''
 
-        run_tool_stats = tool_stats_by_run.get(r['id'], [])
-        tool_panel_html = _generate_tool_stats_panel(run_tool_stats)
-
-        table_rows += (
+        out.write(
             f"<tr{row_style}>"
             f"<td>{r['id']}</td>"
             f"<td>{skill_str}{badge}</td>"
@@ -579,53 +769,38 @@ def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict
             f"<td class=\"text-muted\">{model_str}</td>"
             f"</tr>\n"
         )
-        if tool_panel_html:
-            table_rows += (
+        # Most runs have no tool stats; only those with a non-empty entry get
+        # a panel, so the rest skip the lookup default and the panel call.
+        if r['id'] in runs_with_tools:
+            out.write(
                 f'<tr><td colspan="8" style="padding:0;">'
-                f'{tool_panel_html}'
+                f'{_generate_tool_stats_panel(tool_stats_by_run[r["id"]])}'
                 f'</td></tr>\n'
             )
 
-    return f"""\
-<div class="panel" style="margin-bottom: var(--sp-6);">
-  <div class="section-header">All Runs</div>
-  <div class="dash-table-scroll">
-    <table>
-      <thead>
-        <tr>
-          <th>ID</th>
-          <th>Skill</th>
-          <th>Date</th>
-          <th style="text-align:right">Cost</th>
-          <th style="text-align:right">Tokens In</th>
-          <th style="text-align:right">Tokens Out</th>
-          <th>Duration</th>
-          <th>Model</th>
-        </tr>
-      </thead>
-      <tbody>
-        {table_rows}
+    out.write("""
       </tbody>
     </table>
   </div>
-</div>"""
-
+</div>""")
 
 
 def _format_chart_labels(rows: list[dict], period_key: str, period_label: str) -> list[str]:
     """Format period strings into human-readable chart labels."""
+    if period_label == "Daily":
+        suffix, label_fmt = "", "%b %d, %Y"
+    elif period_label == "Monthly":
+        suffix, label_fmt = "-01", "%b %Y"
+    else:
+        return [f"Week of {row[period_key]}" for row in rows]
+
+    # date.fromisoformat is C-implemented and much cheaper than strptime for
+    # the fixed YYYY-MM-DD shape the cost-trend queries emit.
     labels = []
     for row in rows:
         raw = row[period_key]
         try:
-            if period_label == "Daily":
-                dt = datetime.strptime(raw, "%Y-%m-%d")
-                labels.append(dt.strftime("%b %d, %Y"))
-            elif period_label == "Monthly":
-                dt = datetime.strptime(raw + "-01", "%Y-%m-%d")
-                labels.append(dt.strftime("%b %Y"))
-            else:
-                labels.append(f"Week of {raw}")
+            labels.append(date.fromisoformat(raw + suffix).strftime(label_fmt))
         except ValueError:
             labels.append(raw)
     return labels
@@ -652,18 +827,19 @@ def generate_cost_trend_section(cost_trend: list[dict], cost_trend_daily: list[d
     daily_data = _build_chart_dataset(cost_trend_daily, "day", "daily_cost", "Daily")
     weekly_data = _build_chart_dataset(cost_trend, "week_start", "weekly_cost", "Weekly")
     monthly_data = _build_chart_dataset(cost_trend_monthly, "month", "monthly_cost", "Monthly")
-    chart_data = json.dumps({
+    chart_data = _script_json({
         "daily": daily_data,
         "weekly": weekly_data,
         "monthly": monthly_data,
-    }).replace("</", "<\\/")
+    })
     has_cost_data = any(d["costs"] for d in [daily_data, weekly_data, monthly_data])
     empty_msg = '<p class="empty" style="padding:var(--sp-4) 0;">No session cost data available yet.</p>' if not has_cost_data else ''
 
     # --- Skill trend data (aggregated by day/week/month) ---
-    skill_daily_agg: dict[str, float] = {}
-    skill_weekly_agg: dict[str, float] = {}
-    skill_monthly_agg: dict[str, float] = {}
+    # Group runs by local day once, then roll the week and month buckets up
+    # from the per-day sums: the per-run loop does one dict update, and the
+    # week/month math runs once per distinct day rather than once per run.
+    skill_day_totals: dict[date, float] = defaultdict(float)
     for r in skill_runs:
         cost = r.get('cost_dollars') or 0
         if not cost:
@@ -671,22 +847,29 @@ def generate_cost_trend_section(cost_trend: list[dict], cost_trend_daily: list[d
         started = _parse_dt(r.get('started_at') or '')
         if started is None:
             continue
-        local = started.astimezone()
-        day_key = local.strftime('%Y-%m-%d')
-        week_start = (local - timedelta(days=local.weekday())).strftime('%Y-%m-%d')
-        month_key = local.strftime('%Y-%m')
-        skill_daily_agg[day_key] = round(skill_daily_agg.get(day_key, 0) + cost, 4)
-        skill_weekly_agg[week_start] = round(skill_weekly_agg.get(week_start, 0) + cost, 4)
-        skill_monthly_agg[month_key] = round(skill_monthly_agg.get(month_key, 0) + cost, 4)
-
-    skill_daily_rows = [{"day": k, "daily_cost": v} for k, v in sorted(skill_daily_agg.items())]
-    skill_weekly_rows = [{"week_start": k, "weekly_cost": v} for k, v in sorted(skill_weekly_agg.items())]
-    skill_monthly_rows = [{"month": k, "monthly_cost": v} for k, v in sorted(skill_monthly_agg.items())]
-    skill_trend_data = json.dumps({
+        local_day = started.astimezone().date()
+        # Sums stay unrounded here; rounding once per bucket below is enough.
+        skill_day_totals[local_day] += cost
+
+    skill_daily_agg: dict[str, float] = {}
+    skill_weekly_agg: dict[str, float] = defaultdict(float)
+    skill_monthly_agg: dict[str, float] = defaultdict(float)
+    for local_day, cost in skill_day_totals.items():
+        day_key = local_day.isoformat()
+        week_start = (local_day - timedelta(days=local_day.weekday())).isoformat()
+        month_key = day_key[:7]
+        skill_daily_agg[day_key] = cost
+        skill_weekly_agg[week_start] += cost
+        skill_monthly_agg[month_key] += cost
+
+    skill_daily_rows = [{"day": k, "daily_cost": round(v, 4)} for k, v in sorted(skill_daily_agg.items())]
+    skill_weekly_rows = [{"week_start": k, "weekly_cost": round(v, 4)} for k, v in sorted(skill_weekly_agg.items())]
+    skill_monthly_rows = [{"month": k, "monthly_cost": round(v, 4)} for k, v in sorted(skill_monthly_agg.items())]
+    skill_trend_data = _script_json({
         "daily": _build_chart_dataset(skill_daily_rows, "day", "daily_cost", "Daily"),
         "weekly": _build_chart_dataset(skill_weekly_rows, "week_start", "weekly_cost", "Weekly"),
         "monthly": _build_chart_dataset(skill_monthly_rows, "month", "monthly_cost", "Monthly"),
-    }).replace("</", "<\\/")
+    })
     has_skill_trend = bool(skill_daily_agg or skill_weekly_agg or skill_monthly_agg)
     empty_skill_msg = '<p class="empty" style="padding:var(--sp-4) 0;">No skill cost data available yet.</p>' if not has_skill_trend else ''
 
@@ -1398,106 +1581,81 @@ def generate_filter_bar() -> str:
 
 def generate_table_header() -> str:
     """Generate the table thead."""
-    return """\
-<thead>
-  <tr>
-    <th data-col="0" data-type="num">ID <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="1" data-type="str">Task <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="2" data-type="num" style="text-align:right" class="sort-desc">Cost <span class="sort-arrow">\u25BC</span></th>
-    <th data-col="3" data-type="str">Status <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="4" data-type="num" style="text-align:right" title="For Done tasks: wall-clock span from first session start to last session end (includes gaps between sessions). For active tasks: time elapsed since first started (In Progress) or created (To Do).">Duration <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="5" data-type="num">Size <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="6" data-type="num" style="text-align:right">WSJF <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="7" data-type="str">Model <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="8" data-type="num" style="text-align:right">Work Time <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="9" data-type="num" style="text-align:right">Lines <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="10" data-type="num" style="text-align:right">Tokens In <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="11" data-type="num" style="text-align:right">Tokens Out <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="12" data-type="num" style="text-align:right" title="Context window % at the start of the earliest session">Ctx% Start <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="13" data-type="num" style="text-align:right" title="Peak context window % reached across all sessions">Ctx% Peak <span class="sort-arrow">\u25B2</span></th>
-    <th data-col="14" data-type="num" style="text-align:right" title="Context window % at the end of the latest session">Ctx% End <span class="sort-arrow">\u25B2</span></th>
-  </tr>
-</thead>"""
+    return _TABLE_HEADER_HTML
 
 
-def build_dep_badges(tid: int, task_deps: dict, summary_map: dict) -> str:
-    """Build HTML for dependency badges, or empty string if none."""
-    deps = task_deps.get(tid)
-    if not deps:
-        return ""
+@functools.lru_cache(maxsize=8192)
+def _dep_badge(dep_id: int, dep_type: str, tooltip: str) -> str:
+    """Return the link badge for one dependency.
+
+    A task blocking many others appears in each of their badge lists; caching
+    on (id, type, tooltip) builds that fragment once and shares the string.
+    """
+    return (
+        f'<a class="dep-link dep-type-{_esc_enum(dep_type)}" data-target="{dep_id}"'
+        f' title="{esc(tooltip)}">#{dep_id}</a>'
+    )
+
+
+def _dep_badge_group_to(out, label: str, deps: list[dict], summary_map: dict) -> None:
+    """Write one labelled dependency group (e.g. "Blocked by") to ``out``."""
+    write = out.write
+    write(f'<span class="dep-group"><span class="dep-label">{label}</span> ')
+    for d in deps:
+        dep_id = d["id"]
+        write(_dep_badge(dep_id, d["type"], summary_map.get(dep_id, f"Task #{dep_id}")))
+    write('</span>')
+
+
+def _dep_badges_html(deps: dict, summary_map: dict) -> str:
+    """Build the badge HTML for one task's ``task_deps`` entry."""
     blocked_by = deps.get("blocked_by", [])
     blocks = deps.get("blocks", [])
     if not blocked_by and not blocks:
         return ""
-    parts = []
+    out = io.StringIO()
+    out.write('<div class="dep-badges">')
     if blocked_by:
-        badges = []
-        for d in blocked_by:
-            tooltip = esc(summary_map.get(d["id"], f"Task #{d['id']}"))
-            css = f'dep-link dep-type-{esc(d["type"])}'
-            badges.append(
-                f'<a class="{css}" data-target="{d["id"]}" title="{tooltip}">#{d["id"]}</a>'
-            )
-        parts.append(
-            f'<span class="dep-group"><span class="dep-label">Blocked by</span> {"".join(badges)}</span>'
-        )
+        _dep_badge_group_to(out, "Blocked by", blocked_by, summary_map)
     if blocks:
-        badges = []
-        for d in blocks:
-            tooltip = esc(summary_map.get(d["id"], f"Task #{d['id']}"))
-            css = f'dep-link dep-type-{esc(d["type"])}'
-            badges.append(
-                f'<a class="{css}" data-target="{d["id"]}" title="{tooltip}">#{d["id"]}</a>'
-            )
-        parts.append(
-            f'<span class="dep-group"><span class="dep-label">Blocks</span> {"".join(badges)}</span>'
-        )
-    return f'<div class="dep-badges">{"".join(parts)}</div>'
-
+        _dep_badge_group_to(out, "Blocks", blocks, summary_map)
+    out.write('</div>')
+    return out.getvalue()
 
-def generate_criteria_detail(tid: int, has_criteria: bool = True, tool_stats: list[dict] = None) -> str:
-    """Generate the collapsible detail row for a task.
 
-    Contains an optional criteria panel (client-side rendered from JSON) and
-    an optional tool cost breakdown panel (server-side rendered).
-    """
-    inner = ""
+def generate_criteria_detail_to(out, tid: int, has_criteria: bool = True, tool_stats: list[dict] | None = None) -> None:
+    """Write the collapsible detail row for a task to ``out`` (any object with ``.write``)."""
+    write = out.write
+    write(f'<tr class="criteria-row" data-parent="{tid}" style="display:none">\n  <td colspan="15">')
 
     if has_criteria:
-        sort_bar = (
-            '<div class="criteria-sort-bar">'
-            '<span class="criteria-sort-label">Sort:</span>'
-            '<button class="criteria-sort-btn" data-sort-key="completed">Completed <span class="sort-arrow">&#9650;</span></button>'
-            '<button class="criteria-sort-btn" data-sort-key="cost">Cost <span class="sort-arrow">&#9650;</span></button>'
-            '<button class="criteria-sort-btn" data-sort-key="commit">Commit <span class="sort-arrow">&#9650;</span></button>'
-            '</div>'
-        )
-        inner += (
+        write(
             f'<div class="criteria-detail" data-tid="{tid}">'
-            f'{sort_bar}'
+            f'{_CRITERIA_SORT_BAR_HTML}'
             f'<div class="criteria-render-target"></div>'
             f'</div>'
         )
 
     if tool_stats:
-        inner += _generate_tool_stats_panel(tool_stats)
+        write(_generate_tool_stats_panel(tool_stats))
 
-    return (
-        f'<tr class="criteria-row" data-parent="{tid}" style="display:none">\n'
-        f'  <td colspan="15">{inner}</td>\n'
-        f'</tr>\n'
-    )
+    write('</td>\n</tr>\n')
 
 
-def generate_task_row(t: dict, criteria_list: list[dict], task_deps: dict, summary_map: dict, max_cost: float = 0, tool_stats: list[dict] = None) -> str:
-    """Generate a single task table row (and optional criteria/tool-cost detail row)."""
+def generate_task_row_to(out, t: dict, criteria_list: list[dict], task_deps: dict, summary_map: dict,
+                         max_cost: float = 0, tool_stats: list[dict] | None = None) -> None:
+    """Write a task row (and optional detail row) to ``out`` (any object with ``.write``).
+
+    Rendering the whole task table into one shared buffer avoids
+    materializing a string per row only to concatenate it again.
+    """
     has_data = t["session_count"] > 0
-    status_val = esc(t['status'])
+    status_val = _esc_enum(t['status'])
     tid = t['id']
     has_criteria = len(criteria_list) > 0
     has_tool_stats = bool(tool_stats)
     has_expandable = has_criteria or has_tool_stats
-    toggle_icon = '<span class="expand-icon">&#9654;</span> ' if has_expandable else ''
+    toggle_icon = _EXPAND_ICON_HTML if has_expandable else ''
 
     row_classes = []
     if not has_data:
@@ -1507,88 +1665,106 @@ def generate_task_row(t: dict, criteria_list: list[dict], task_deps: dict, summa
     cls_attr = f' class="{" ".join(row_classes)}"' if row_classes else ''
 
     priority_score = t.get('priority_score') or 0
-    complexity_val = esc(t.get('complexity') or '')
-    complexity_sort = COMPLEXITY_SORT_ORDER.get(t.get('complexity') or '', 0)
-    domain_val = esc(t.get('domain') or '')
-    task_type_val = esc(t.get('task_type') or '')
-    session_count = t.get('session_count') or 0
+    complexity_raw = t.get('complexity') or ''
+    complexity_val = _esc_enum(complexity_raw)
+    complexity_ord = COMPLEXITY_ORD.get(complexity_raw)
+    complexity_sort = 0 if complexity_ord is None else _COMPLEXITY_SORT_KEY_BY_ORD[complexity_ord]
+    task_type_val = _esc_enum(t.get('task_type') or '')
     models_raw = t.get('models') or ''
+    models_esc = _esc_enum(models_raw)
     duration_seconds = t.get('total_duration_seconds') or 0
     active_seconds = t.get('total_active_seconds') or 0
     status_duration_seconds = t.get('duration_in_status_seconds') or 0
     lines_added = t.get('total_lines_added') or 0
     lines_removed = t.get('total_lines_removed') or 0
     total_lines = int(lines_added) + int(lines_removed)
-    dep_badges = build_dep_badges(tid, task_deps, summary_map)
-    summary_cell = f'<div class="summary-text">{esc(t["summary"])}</div>{dep_badges}'
+    summary_esc = esc(t["summary"])
+    summary_cell = _SUMMARY_OPEN_HTML + summary_esc + _SUMMARY_CLOSE_HTML
+    # Most tasks have no dependencies; only pay for the badge builder when
+    # this task actually has an entry.
+    deps = task_deps.get(tid)
+    if deps:
+        summary_cell += _dep_badges_html(deps, summary_map)
 
     # Cost heatmap class for the cost cell
-    heat_cls = cost_heat_class(t['total_cost'], max_cost)
-    cost_cls = f'col-cost {heat_cls}'.strip()
-
-    row = f"""<tr{cls_attr} data-status="{status_val}" data-summary="{esc(t['summary']).lower()}" data-task-id="{tid}" data-complexity="{complexity_val}" data-type="{task_type_val}">
-  <td class="col-id" data-sort="{tid}">{toggle_icon}#{tid}</td>
-  <td class="col-summary">{summary_cell}</td>
-  <td class="{cost_cls}" data-sort="{t['total_cost']}">{format_cost(t['total_cost'])}</td>
-  <td class="col-status"><span class="status-badge status-{status_val.lower().replace(' ', '-')}">{status_val}</span></td>
-  <td class="col-status-duration" data-sort="{status_duration_seconds}" style="text-align:right">{format_status_duration(status_duration_seconds) if status_duration_seconds else '<span class="text-muted-dash">&mdash;</span>'}</td>
-  <td class="col-complexity" data-sort="{complexity_sort}">{f'<span class="complexity-badge">{complexity_val}</span>' if complexity_val else ''}</td>
-  <td class="col-wsjf" data-sort="{priority_score}">{priority_score}</td>
-  <td class="col-model" data-sort="{esc(models_raw)}" title="{esc(models_raw)}">{esc(models_raw) if models_raw else '<span class="text-muted-dash">&mdash;</span>'}</td>
-  <td class="col-duration" data-sort="{duration_seconds}" title="wall: {format_duration(duration_seconds)} · active (idle-discounted): {format_duration(active_seconds)}">{format_duration(duration_seconds) if duration_seconds else '<span class="text-muted-dash">&mdash;</span>'}</td>
-  <td class="col-lines" data-sort="{total_lines}" data-lines-added="{int(lines_added)}" data-lines-removed="{int(lines_removed)}">{format_lines_html(lines_added, lines_removed)}</td>
-  <td class="col-tokens-in" data-sort="{t['total_tokens_in']}">{format_tokens_compact(t['total_tokens_in'])}</td>
-  <td class="col-tokens-out" data-sort="{t['total_tokens_out']}">{format_tokens_compact(t['total_tokens_out'])}</td>
-  <td class="col-ctx-start" data-sort="{t.get('first_ctx_pct') if t.get('first_ctx_pct') is not None else -1}" style="text-align:right">{format_ctx_pct(t.get('first_ctx_pct'))}</td>
-  <td class="col-ctx-peak" data-sort="{t.get('peak_ctx_pct') if t.get('peak_ctx_pct') is not None else -1}" style="text-align:right">{format_ctx_pct(t.get('peak_ctx_pct'), color=True)}</td>
-  <td class="col-ctx-end" data-sort="{t.get('last_ctx_pct') if t.get('last_ctx_pct') is not None else -1}" style="text-align:right">{format_ctx_pct(t.get('last_ctx_pct'))}</td>
-</tr>\n"""
+    cost_cls = _COST_CELL_CLASS[cost_heat_class(t['total_cost'], max_cost)]
+    status_cls = _STATUS_CSS.get(status_val) or f"status-{status_val.lower().replace(' ', '-')}"
+
+    first_ctx = t.get('first_ctx_pct')
+    peak_ctx = t.get('peak_ctx_pct')
+    last_ctx = t.get('last_ctx_pct')
+    duration_fmt = format_duration(duration_seconds)
+    out.write(_TASK_ROW_FMT % (
+        # <tr> attributes
+        cls_attr,
+        status_val,
+        summary_esc.lower(),
+        tid,
+        complexity_val,
+        task_type_val,
+        # id, summary, cost
+        tid,
+        toggle_icon,
+        tid,
+        summary_cell,
+        cost_cls,
+        t['total_cost'],
+        format_cost(t['total_cost']),
+        # status, time in status, complexity, WSJF, model
+        status_cls,
+        status_val,
+        status_duration_seconds,
+        format_status_duration(status_duration_seconds) if status_duration_seconds else _MUTED_DASH_HTML,
+        complexity_sort,
+        f'<span class="complexity-badge">{complexity_val}</span>' if complexity_val else '',
+        priority_score,
+        priority_score,
+        models_esc,
+        models_esc,
+        models_esc if models_raw else _MUTED_DASH_HTML,
+        # duration, lines, tokens
+        duration_seconds,
+        duration_fmt,
+        format_duration(active_seconds),
+        duration_fmt if duration_seconds else _MUTED_DASH_HTML,
+        total_lines,
+        int(lines_added),
+        int(lines_removed),
+        format_lines_html(lines_added, lines_removed),
+        t['total_tokens_in'],
+        format_tokens_compact(t['total_tokens_in']),
+        t['total_tokens_out'],
+        format_tokens_compact(t['total_tokens_out']),
+        # context window start / peak / end
+        first_ctx if first_ctx is not None else -1,
+        format_ctx_pct(first_ctx),
+        peak_ctx if peak_ctx is not None else -1,
+        format_ctx_pct(peak_ctx, color=True),
+        last_ctx if last_ctx is not None else -1,
+        format_ctx_pct(last_ctx),
+    ))
 
     if has_expandable:
-        row += generate_criteria_detail(tid, has_criteria=has_criteria, tool_stats=tool_stats)
-
-    return row
+        generate_criteria_detail_to(out, tid, has_criteria=has_criteria, tool_stats=tool_stats)
 
 
 
 def generate_pagination() -> str:
     """Generate the pagination bar."""
-    return """\
-<div class="pagination-bar" id="paginationBar">
-  <span class="page-info" id="pageInfo"></span>
-  <div class="pagination-controls">
-    <label>Per page:
-      <select class="page-size-select" id="pageSize">
-        <option value="10">10</option>
-        <option value="25">25</option>
-        <option value="50">50</option>
-        <option value="0">All</option>
-      </select>
-    </label>
-    <button class="page-btn" id="prevPage">\u2190 Prev</button>
-    <button class="page-btn" id="nextPage">Next \u2192</button>
-  </div>
-</div>"""
-
-
-
-
-def generate_complexity_section(complexity_metrics: list[dict] | None) -> str:
-    """Generate the estimate vs. actual complexity section."""
-    if not complexity_metrics:
-        return ""
-
-    complexity_rows = ""
-    for c in complexity_metrics:
-        tier = c['complexity']
-        expected = EXPECTED_SESSIONS.get(tier, (0, 0))
-        lo, hi = expected
-        expected_str = f"{lo:.0f}&ndash;{hi:.0f}" if lo == int(lo) and hi == int(hi) else f"{lo}&ndash;{hi}"
-        avg_sessions = c['avg_sessions'] or 0
-        exceeds = avg_sessions > hi
-        row_css = ' class="tier-exceeds"' if exceeds else ''
-        flag = ' <span class="tier-flag">&#9888;</span>' if exceeds else ''
-        complexity_rows += f"""<tr{row_css}>
+    return _PAGINATION_HTML
+
+
+def _complexity_row(c: dict) -> str:
+    """Return one tier row of the estimate vs. actual table."""
+    tier = c['complexity']
+    tier_ord = COMPLEXITY_ORD.get(tier)
+    lo, hi = (0, 0) if tier_ord is None else _EXPECTED_SESSIONS_BY_ORD[tier_ord]
+    expected_str = f"{lo:.0f}&ndash;{hi:.0f}" if lo == int(lo) and hi == int(hi) else f"{lo}&ndash;{hi}"
+    avg_sessions = c['avg_sessions'] or 0
+    exceeds = avg_sessions > hi
+    row_css = ' class="tier-exceeds"' if exceeds else ''
+    flag = ' <span class="tier-flag">&#9888;</span>' if exceeds else ''
+    return f"""<tr{row_css}>
   <td class="col-complexity"><span class="complexity-badge">{esc(tier)}</span></td>
   <td class="col-count">{c['task_count']}</td>
   <td class="col-expected">{expected_str}</td>
@@ -1597,6 +1773,14 @@ def generate_complexity_section(complexity_metrics: list[dict] | None) -> str:
   <td class="col-avg-cost">{format_cost(c['avg_cost'])}</td>
 </tr>\n"""
 
+
+def generate_complexity_section(complexity_metrics: list[dict] | None) -> str:
+    """Generate the estimate vs. actual complexity section."""
+    if not complexity_metrics:
+        return ""
+
+    complexity_rows = "".join(map(_complexity_row, complexity_metrics))
+
     return f"""
 <div class="panel" style="margin-top: var(--sp-6);">
   <div class="section-header">Estimate vs. Actual</div>
@@ -1634,17 +1818,21 @@ def generate_dag_section(dag_tasks: list[dict], edges: list[dict],
 
     # Build task data JSON for sidebar
     task_data: dict[int, dict] = {}
-    blockers_by_task: dict[int, list] = defaultdict(list)
-    for b in dag_blockers:
-        blockers_by_task[b["task_id"]].append({
+    # One stable sort + groupby gives each task with blockers exactly one
+    # list; tasks without blockers share the _EMPTY_TUPLE singleton.
+    _task_id = itemgetter("task_id")
+    blockers_by_task: dict[int, list] = {
+        tid: [{
             "id": b["id"],
             "description": b["description"],
             "blocker_type": b["blocker_type"],
             "is_resolved": b["is_resolved"],
-        })
+        } for b in group]
+        for tid, group in groupby(sorted(dag_blockers, key=_task_id), key=_task_id)
+    }
 
     for t in dag_tasks:
-        tb = blockers_by_task.get(t["id"], [])
+        tb = blockers_by_task.get(t["id"], _EMPTY_TUPLE)
         task_data[t["id"]] = {
             "id": t["id"],
             "summary": t["summary"],
@@ -1674,10 +1862,10 @@ def generate_dag_section(dag_tasks: list[dict], edges: list[dict],
             "is_resolved": b["is_resolved"],
         }
 
-    task_json = json.dumps(task_data).replace("</", "<\\/")
-    blocker_json = json.dumps(blocker_data).replace("</", "<\\/")
-    mermaid_default_json = json.dumps(mermaid_default).replace("</", "<\\/")
-    mermaid_all_json = json.dumps(mermaid_all).replace("</", "<\\/")
+    task_json = _script_json(task_data)
+    blocker_json = _script_json(blocker_data)
+    mermaid_default_json = _script_json(mermaid_default)
+    mermaid_all_json = _script_json(mermaid_all)
 
     has_edges = len(edges) > 0 or len(dag_blockers) > 0
     hint = "" if has_edges else '<p class="dag-hint">No dependencies yet. Use <code>tusk deps add</code> to connect tasks.</p>'
@@ -1698,27 +1886,7 @@ var DAG_MERMAID_ALL = {mermaid_all_json};
   <div class="dag-graph-panel">
     <div id="dagMermaidContainer"></div>
     {hint}
-    <div class="dag-legend">
-      <div class="dag-legend-title">Legend</div>
-      <div class="dag-legend-row">
-        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#3b82f6"></span> To Do</span>
-        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#f59e0b"></span> In Progress</span>
-        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#22c55e"></span> Done</span>
-        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#ef4444"></span> Blocker</span>
-        <span class="dag-legend-item"><span class="dag-legend-swatch" style="background:#9ca3af"></span> Resolved</span>
-      </div>
-      <div class="dag-legend-row">
-        <span class="dag-legend-item">[rect] = XS/S</span>
-        <span class="dag-legend-item">(rounded) = M</span>
-        <span class="dag-legend-item">&#x2B21; hexagon = L/XL</span>
-        <span class="dag-legend-item">&#x25B7; flag = blocker</span>
-      </div>
-      <div class="dag-legend-row">
-        <span class="dag-legend-item">&mdash;&mdash;&gt; blocks</span>
-        <span class="dag-legend-item">- - -&gt; contingent</span>
-        <span class="dag-legend-item">-&middot;-x blocker</span>
-      </div>
-    </div>
+{_DAG_LEGEND_HTML}
   </div>
   <div class="dag-sidebar">
     <div class="dag-sidebar-placeholder" id="dagPlaceholder">
@@ -1732,6 +1900,7 @@ var DAG_MERMAID_ALL = {mermaid_all_json};
 </div>"""
 
 
+@functools.lru_cache(maxsize=1)
 def generate_js() -> str:
-    """Generate all dashboard JavaScript."""
+    """Generate all dashboard JavaScript (memoized, like generate_css)."""
     return '<script>\n' + tusk_loader.load("tusk-dashboard-js").JS + '\n</script>'
@@ -12,6 +12,7 @@ Arguments received from tusk:
     sys.argv[2] — config path
 """
 
+import io
 import json
 import logging
 import os
@@ -77,7 +78,7 @@ generate_table_header = _html.generate_table_header
 generate_pagination = _html.generate_pagination
 generate_dag_section = _html.generate_dag_section
 generate_js = _html.generate_js
-generate_task_row = _html.generate_task_row
+generate_task_row_to = _html.generate_task_row_to
 
 
 def _tz_label(offset_minutes: int) -> str:
@@ -157,14 +158,14 @@ def generate_html(task_metrics: list[dict],
 
     # Task rows
     if task_metrics:
-        task_rows = ""
+        rows_buf = io.StringIO()
         for t in task_metrics:
             tid = t['id']
-            criteria_list = all_criteria.get(tid, [])
-            task_rows += generate_task_row(
-                t, criteria_list, task_deps, summary_map, max_cost,
+            generate_task_row_to(
+                rows_buf, t, all_criteria.get(tid, []), task_deps, summary_map, max_cost,
                 tool_stats=tool_stats_by_task.get(tid)
             )
+        task_rows = rows_buf.getvalue()
     else:
         task_rows = '<tr><td colspan="12" class="empty">No tasks found. Run <code>tusk init</code> and add some tasks.</td></tr>'
 
@@ -433,10 +434,14 @@ def main():
         rework_rate=rework_rate,
         project_name=project_name,
     )
-    log.debug("Generated %d bytes of HTML", len(html_content))
+    # Encode once, in the UTF-8 the page's <meta charset> declares, and write
+    # the bytes directly instead of going through a locale-dependent text
+    # layer with newline translation.
+    html_bytes = html_content.encode("utf-8")
+    log.debug("Generated %d bytes of HTML", len(html_bytes))
     output_path = os.path.join(db_dir, f"{project_name}-dashboard.html")
-    with open(output_path, "w") as f:
-        f.write(html_content)
+    with open(output_path, "wb") as f:
+        f.write(html_bytes)
     log.debug("Wrote dashboard to %s", output_path)
 
     print(f"Dashboard written to {output_path}")
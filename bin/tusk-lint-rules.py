@@ -4,6 +4,8 @@
 Called by the tusk wrapper:
     tusk lint-rule add <pattern> <file_glob> <message> [--blocking] [--advisory]
                        [--skill <name>]
+    tusk lint-rule add-many [--file <path>] [--blocking] [--advisory]
+                            [--skill <name>]
     tusk lint-rule propose <pattern> <file_glob> <message>
                            [--finding-id <id>] [--skill <name>]
     tusk lint-rule list
@@ -20,6 +22,7 @@ Arguments received from tusk:
 """
 
 import argparse
+import itertools
 import os
 import sqlite3
 import sys
@@ -31,18 +34,38 @@ _db_lib = tusk_loader.load("tusk-db-lib")
 get_connection = _db_lib.get_connection
 
 
+_SQL_INSERT_RULE = (
+    "INSERT INTO lint_rules"
+    " (grep_pattern, file_glob, message, is_blocking, source_skill, enforcement)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_LIST = (
+    "SELECT id, grep_pattern, file_glob, message, is_blocking, source_skill,"
+    " enforcement, created_at"
+    " FROM lint_rules ORDER BY id"
+)
+_SQL_EXISTS = "SELECT id FROM lint_rules WHERE id = ?"
+_SQL_DELETE = "DELETE FROM lint_rules WHERE id = ?"
+
+
+def _rule_params(pattern: str, file_glob: str, message: str, *,
+                 blocking: bool = False, advisory: bool = False,
+                 skill: str | None = None) -> tuple:
+    """Build the ``_SQL_INSERT_RULE`` parameter tuple for one rule."""
+    return (pattern, file_glob, message,
+            1 if blocking else 0,
+            skill,
+            "advisory" if advisory else "enforcing")
+
+
 def cmd_add(args: argparse.Namespace, db_path: str) -> int:
-    enforcement = "advisory" if args.advisory else "enforcing"
     conn = get_connection(db_path)
     try:
         cur = conn.execute(
-            "INSERT INTO lint_rules"
-            " (grep_pattern, file_glob, message, is_blocking, source_skill, enforcement)"
-            " VALUES (?, ?, ?, ?, ?, ?)",
-            (args.pattern, args.file_glob, args.message,
-             1 if args.blocking else 0,
-             args.skill,
-             enforcement),
+            _SQL_INSERT_RULE,
+            _rule_params(args.pattern, args.file_glob, args.message,
+                         blocking=args.blocking, advisory=args.advisory,
+                         skill=args.skill),
         )
         conn.commit()
         print(cur.lastrowid)
@@ -51,6 +74,63 @@ def cmd_add(args: argparse.Namespace, db_path: str) -> int:
         conn.close()
 
 
+def _parse_add_many_lines(lines, *, blocking: bool, advisory: bool,
+                          skill: str | None) -> tuple[list[tuple], str | None]:
+    """Parse ``pattern<TAB>file_glob<TAB>message`` lines into insert params.
+
+    Blank lines are skipped; blocking/advisory/skill apply to every rule.
+    Returns (rows, error); error names the first malformed line.
+    """
+    rows: list[tuple] = []
+    for lineno, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        fields = line.split("\t")
+        if len(fields) != 3 or not all(f.strip() for f in fields):
+            return [], f"line {lineno}: expected pattern<TAB>file_glob<TAB>message"
+        pattern, file_glob, message = (f.strip() for f in fields)
+        rows.append(_rule_params(pattern, file_glob, message,
+                                 blocking=blocking, advisory=advisory, skill=skill))
+    return rows, None
+
+
+def cmd_add_many(args: argparse.Namespace, db_path: str) -> int:
+    """Add many lint rules from --file (or stdin) in one transaction.
+
+    Every line is validated before the DB is opened, then the whole batch goes
+    through a single ``executemany`` and one commit, so N rules cost one WAL
+    sync instead of N. Nothing is inserted if any row fails.
+    """
+    if args.file and args.file != "-":
+        try:
+            with open(args.file, encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError as e:
+            print(f"Error: cannot read {args.file}: {e}", file=sys.stderr)
+            return 2
+    else:
+        lines = sys.stdin.readlines()
+
+    rows, error = _parse_add_many_lines(lines, blocking=args.blocking,
+                                        advisory=args.advisory, skill=args.skill)
+    if error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    if not rows:
+        print("Error: no lint rules to add", file=sys.stderr)
+        return 2
+
+    conn = get_connection(db_path)
+    try:
+        conn.executemany(_SQL_INSERT_RULE, rows)
+        conn.commit()
+        print(f"Added {len(rows)} lint rule{'s' if len(rows) != 1 else ''}.")
+        return 0
+    finally:
+        conn.close()
+
+
 def cmd_propose(args: argparse.Namespace, db_path: str) -> int:
     """Stage a grep-detectable anti-pattern surfaced by /retro as an advisory rule.
 
@@ -92,26 +172,31 @@ def cmd_propose(args: argparse.Namespace, db_path: str) -> int:
 def cmd_list(db_path: str) -> int:
     conn = get_connection(db_path)
     try:
-        rows = conn.execute(
-            "SELECT id, grep_pattern, file_glob, message, is_blocking, source_skill,"
-            " enforcement, created_at"
-            " FROM lint_rules ORDER BY id"
-        ).fetchall()
-        if not rows:
+        # Iterate the cursor directly rather than materializing every rule;
+        # the first row is pulled up front only to detect the empty case.
+        cur = conn.execute(_SQL_LIST)
+        first = cur.fetchone()
+        if first is None:
             print("No lint rules defined.")
             return 0
-        fmt = "{:<5} {:<10} {:<10} {:<18} {:<30} {}"
-        print(fmt.format("ID", "BLOCKING", "ENFORCE", "FILE_GLOB", "PATTERN", "MESSAGE"))
-        print("-" * 90)
-        for row in rows:
+        fmt_format = "{:<5} {:<10} {:<10} {:<18} {:<30} {}".format
+        out = [
+            fmt_format("ID", "BLOCKING", "ENFORCE", "FILE_GLOB", "PATTERN", "MESSAGE"),
+            "-" * 90,
+        ]
+        append = out.append
+        for row in itertools.chain((first,), cur):
             blocking = "yes" if row["is_blocking"] else "no"
             enforcement = row["enforcement"]
             pattern = row["grep_pattern"]
             if len(pattern) > 28:
                 pattern = pattern[:25] + "..."
             message = row["message"]
-            print(fmt.format(
+            append(fmt_format(
                 row["id"], blocking, enforcement, row["file_glob"], pattern, message))
+        # One write for the whole table instead of a print() per rule.
+        out.append("")
+        sys.stdout.write("\n".join(out))
         return 0
     finally:
         conn.close()
@@ -146,9 +231,7 @@ def cmd_update(args: argparse.Namespace, db_path: str) -> int:
 
     conn = get_connection(db_path)
     try:
-        existing = conn.execute(
-            "SELECT id FROM lint_rules WHERE id = ?", (args.id,)
-        ).fetchone()
+        existing = conn.execute(_SQL_EXISTS, (args.id,)).fetchone()
         if not existing:
             print(f"Error: lint rule {args.id} not found", file=sys.stderr)
             return 2
@@ -167,13 +250,11 @@ def cmd_update(args: argparse.Namespace, db_path: str) -> int:
 def cmd_remove(args: argparse.Namespace, db_path: str) -> int:
     conn = get_connection(db_path)
     try:
-        existing = conn.execute(
-            "SELECT id FROM lint_rules WHERE id = ?", (args.id,)
-        ).fetchone()
+        existing = conn.execute(_SQL_EXISTS, (args.id,)).fetchone()
         if not existing:
             print(f"Error: lint rule {args.id} not found", file=sys.stderr)
             return 2
-        conn.execute("DELETE FROM lint_rules WHERE id = ?", (args.id,))
+        conn.execute(_SQL_DELETE, (args.id,))
         conn.commit()
         print(f"Removed lint rule {args.id}.")
         return 0
@@ -207,7 +288,7 @@ def cmd_promote(args: argparse.Namespace, db_path: str) -> int:
 
 def main(argv: list[str]) -> int:
     if len(argv) < 3:
-        print("Usage: tusk lint-rule {add|propose|list|update|promote|remove} ...", file=sys.stderr)
+        print("Usage: tusk lint-rule {add|add-many|propose|list|update|promote|remove} ...", file=sys.stderr)
         return 2
 
     db_path = argv[1]
@@ -233,6 +314,20 @@ def main(argv: list[str]) -> int:
         args = parser.parse_args(argv[4:])
         return cmd_add(args, db_path)
 
+    elif subcommand == "add-many":
+        parser = argparse.ArgumentParser(allow_abbrev=False, prog="tusk lint-rule add-many")
+        parser.add_argument("--file", default=None, metavar="PATH",
+                            help="read pattern<TAB>file_glob<TAB>message lines from PATH "
+                                 "instead of stdin ('-' also means stdin)")
+        parser.add_argument("--blocking", action="store_true",
+                            help="make every added rule blocking")
+        parser.add_argument("--advisory", action="store_true",
+                            help="stage every added rule advisory-only")
+        parser.add_argument("--skill", default=None, metavar="NAME",
+                            help="skill that created these rules")
+        args = parser.parse_args(argv[4:])
+        return cmd_add_many(args, db_path)
+
     elif subcommand == "propose":
         parser = argparse.ArgumentParser(allow_abbrev=False, prog="tusk lint-rule propose")
         parser.add_argument("pattern", help="grep pattern to search for")
@@ -289,13 +384,13 @@ def main(argv: list[str]) -> int:
 
     else:
         print(f"Unknown subcommand: {subcommand!r}", file=sys.stderr)
-        print("Usage: tusk lint-rule {add|propose|list|update|promote|remove} ...", file=sys.stderr)
+        print("Usage: tusk lint-rule {add|add-many|propose|list|update|promote|remove} ...", file=sys.stderr)
         return 2
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2 or not sys.argv[1].endswith(".db"):
         print("Error: This script must be invoked via the tusk wrapper.", file=sys.stderr)
-        print("Use: tusk lint-rule {add|propose|list|update|remove} ...", file=sys.stderr)
+        print("Use: tusk lint-rule {add|add-many|propose|list|update|promote|remove} ...", file=sys.stderr)
         sys.exit(1)
     sys.exit(main(sys.argv))
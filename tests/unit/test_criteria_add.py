@@ -0,0 +1,111 @@
+"""Unit tests for tusk criteria add — task-existence folding and returned id.
+
+cmd_add folds the task-exists check into the INSERT itself
+(INSERT … SELECT … WHERE EXISTS), so a missing task must surface as
+"Task N not found" / exit 2 with nothing written, and a successful insert must
+report the id of the row it just created.
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import sqlite3
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_spec = importlib.util.spec_from_file_location(
+    "tusk_criteria",
+    os.path.join(REPO_ROOT, "bin", "tusk-criteria.py"),
+)
+criteria_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(criteria_mod)
+
+
+class _NoCloseConn:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        pass
+
+
+def _make_db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, summary TEXT)")
+    conn.execute(
+        "CREATE TABLE acceptance_criteria ("
+        "  id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        "  task_id INTEGER, criterion TEXT, source TEXT DEFAULT 'original',"
+        "  is_completed INTEGER DEFAULT 0, is_deferred INTEGER DEFAULT 0,"
+        "  deferred_reason TEXT, criterion_type TEXT DEFAULT 'manual',"
+        "  verification_spec TEXT,"
+        "  created_at TEXT DEFAULT (datetime('now')),"
+        "  updated_at TEXT DEFAULT (datetime('now')))"
+    )
+    conn.execute("INSERT INTO tasks (id, summary) VALUES (1, 'host task')")
+    conn.execute("INSERT INTO acceptance_criteria (task_id, criterion) VALUES (1, 'pre-existing')")
+    conn.commit()
+    return conn
+
+
+def _run_add(conn, task_id, text="new criterion"):
+    args = argparse.Namespace(
+        task_id=task_id, text=text, source="original", type="manual", spec=None
+    )
+    out, err = io.StringIO(), io.StringIO()
+    with patch.object(criteria_mod, "get_connection", return_value=_NoCloseConn(conn)), \
+         redirect_stdout(out), redirect_stderr(err):
+        rc = criteria_mod.cmd_add(args, ":memory:", {})
+    return rc, out.getvalue(), err.getvalue()
+
+
+class TestCmdAdd:
+    def test_missing_task_reports_not_found_and_writes_nothing(self):
+        conn = _make_db()
+        rc, out, err = _run_add(conn, 99)
+        assert rc == 2
+        assert out == ""
+        assert "Task 99 not found" in err
+        conn.rollback()
+        count = conn.execute("SELECT COUNT(*) FROM acceptance_criteria").fetchone()[0]
+        assert count == 1
+
+    def test_reports_id_of_inserted_row(self):
+        conn = _make_db()
+        rc, out, _ = _run_add(conn, 1, text="second one")
+        assert rc == 0
+        payload = json.loads(out)
+        row = conn.execute(
+            "SELECT criterion FROM acceptance_criteria WHERE id = ?", (payload["id"],)
+        ).fetchone()
+        assert row["criterion"] == "second one"
+        assert payload["task_id"] == 1
+
+    def test_validation_failure_never_opens_connection(self):
+        args = argparse.Namespace(
+            task_id=1, text="uses $(whoami)", source="original", type="manual", spec=None
+        )
+        err = io.StringIO()
+        with patch.object(criteria_mod, "get_connection") as mock_conn, \
+             redirect_stdout(io.StringIO()), redirect_stderr(err):
+            rc = criteria_mod.cmd_add(args, ":memory:", {})
+        assert rc == 1
+        mock_conn.assert_not_called()
+
+    def test_missing_spec_never_opens_connection(self):
+        args = argparse.Namespace(
+            task_id=1, text="tests pass", source="original", type="test", spec=None
+        )
+        with patch.object(criteria_mod, "get_connection") as mock_conn, \
+             redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            rc = criteria_mod.cmd_add(args, ":memory:", {})
+        assert rc == 2
+        mock_conn.assert_not_called()
@@ -0,0 +1,115 @@
+"""Unit tests for tusk criteria add-many — batched single-transaction inserts.
+
+cmd_add_many parses criterion<TAB>source lines, validates every line before
+touching the DB, then inserts them all with one executemany inside a single
+transaction. A bad line or a missing task must leave the table untouched.
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import sqlite3
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_spec = importlib.util.spec_from_file_location(
+    "tusk_criteria",
+    os.path.join(REPO_ROOT, "bin", "tusk-criteria.py"),
+)
+criteria_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(criteria_mod)
+
+
+class _NoCloseConn:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        pass
+
+
+def _make_db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, summary TEXT)")
+    conn.execute(
+        "CREATE TABLE acceptance_criteria ("
+        "  id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        "  task_id INTEGER, criterion TEXT, source TEXT DEFAULT 'original',"
+        "  criterion_type TEXT DEFAULT 'manual')"
+    )
+    conn.execute("INSERT INTO tasks (id, summary) VALUES (1, 'host task')")
+    conn.commit()
+    return conn
+
+
+def _run_add_many(conn, task_id, stdin_text):
+    args = argparse.Namespace(task_id=task_id, file=None)
+    out, err = io.StringIO(), io.StringIO()
+    with patch.object(criteria_mod, "get_connection", return_value=_NoCloseConn(conn)), \
+         patch.object(criteria_mod.sys, "stdin", io.StringIO(stdin_text)), \
+         redirect_stdout(out), redirect_stderr(err):
+        rc = criteria_mod.cmd_add_many(args, ":memory:", {})
+    return rc, out.getvalue(), err.getvalue()
+
+
+def _criteria(conn):
+    return conn.execute(
+        "SELECT task_id, criterion, source, criterion_type FROM acceptance_criteria ORDER BY id"
+    ).fetchall()
+
+
+class TestCmdAddMany:
+    def test_inserts_all_rows_with_default_source(self):
+        conn = _make_db()
+        rc, out, err = _run_add_many(conn, 1, "first\n\nsecond\tpr_review\nthird\tsubsumption\n")
+        assert rc == 0, err
+        assert json.loads(out) == {"task_id": 1, "added": 3}
+        assert _criteria(conn) == [
+            (1, "first", "original", "manual"),
+            (1, "second", "pr_review", "manual"),
+            (1, "third", "subsumption", "manual"),
+        ]
+
+    def test_invalid_source_rejects_whole_batch(self):
+        conn = _make_db()
+        rc, out, err = _run_add_many(conn, 1, "ok\noops\tbogus\n")
+        assert rc == 2
+        assert out == ""
+        assert "line 2" in err and "bogus" in err
+        assert _criteria(conn) == []
+
+    def test_shell_metacharacters_are_stored_verbatim(self):
+        """stdin/--file input never passes through the shell, so the argv
+        metacharacter guard does not apply and the text lands unchanged."""
+        conn = _make_db()
+        text = "echo `date` and $(pwd) keep ${HOME} as $LITERAL"
+        rc, _, err = _run_add_many(conn, 1, text + "\n")
+        assert rc == 0, err
+        assert _criteria(conn) == [(1, text, "original", "manual")]
+
+    def test_error_message_has_single_prefix(self):
+        conn = _make_db()
+        rc, _, err = _run_add_many(conn, 1, "\tpr_review\n")
+        assert rc == 2
+        assert err.startswith("Error: line 1:")
+        assert "Error: Error:" not in err
+
+    def test_missing_task_writes_nothing(self):
+        conn = _make_db()
+        rc, out, err = _run_add_many(conn, 99, "orphan\n")
+        assert rc == 2
+        assert "Task 99 not found" in err
+        assert _criteria(conn) == []
+
+    def test_empty_input_is_an_error(self):
+        conn = _make_db()
+        rc, _, err = _run_add_many(conn, 1, "\n  \n")
+        assert rc == 2
+        assert "no criteria" in err
@@ -262,6 +262,39 @@ class TestDoneSingle:
         obj = json.loads(out.getvalue().strip())
         assert obj["id"] == 1 and obj.get("already_completed") is True
 
+    def test_completed_between_select_and_update_is_not_overwritten(self):
+        """The guarded UPDATE reports already_completed when a concurrent run wins."""
+        conn = make_db()
+
+        class _RacingConn(_NoCloseConn):
+            def execute(self, sql, params=()):
+                cur = self._conn.execute(sql, params)
+                if sql == criteria_mod._SQL_GET_CRITERION_FOR_DONE:
+                    self._conn.execute(
+                        "UPDATE acceptance_criteria SET is_completed = 1, "
+                        "completed_at = '2026-01-01 00:00:00', commit_hash = 'abc1234' "
+                        "WHERE id = 1"
+                    )
+                return cur
+
+        out = io.StringIO()
+        with redirect_stdout(out), \
+             patch.object(criteria_mod, "capture_criterion_cost") as capture:
+            rc = criteria_mod._done_single(_RacingConn(conn), 1, skip_verify=False,
+                                           suppress_shared_commit=True,
+                                           commit_hash=None, committed_at=None)
+        assert rc == 0
+        obj = json.loads(out.getvalue().strip())
+        assert obj["already_completed"] is True
+        # The winner's hash, not the NULL read before the UPDATE.
+        assert obj["commit_hash"] == "abc1234"
+        capture.assert_not_called()
+        row = conn.execute(
+            "SELECT completed_at, commit_hash FROM acceptance_criteria WHERE id = 1"
+        ).fetchone()
+        assert row["completed_at"] == "2026-01-01 00:00:00"
+        assert row["commit_hash"] == "abc1234"
+
     def test_already_completed_refreshes_stale_task_commit_hash(self):
         conn = make_db(criteria_specs=[
             {"criterion_type": "manual", "verification_spec": None, "is_completed": 1},
@@ -0,0 +1,42 @@
+"""Query-plan guard for tusk criteria list.
+
+cmd_list filters acceptance_criteria by task_id and orders by id. The existing
+idx_acceptance_criteria_task_id index already serves both: a SQLite secondary
+index stores the rowid (id) after its key columns, so entries for one task_id
+come out in id order. These tests pin that against a freshly initialized DB so
+a schema or query change that forces a full scan or a temp B-tree sort is
+caught here rather than on a large tasks.db.
+"""
+
+import importlib.util
+import os
+import sqlite3
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_spec = importlib.util.spec_from_file_location(
+    "tusk_criteria",
+    os.path.join(REPO_ROOT, "bin", "tusk-criteria.py"),
+)
+criteria_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(criteria_mod)
+
+
+def _plan(db_path, sql, params):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    finally:
+        conn.close()
+    return [r[-1] for r in rows]
+
+
+class TestCriteriaListQueryPlan:
+    def test_uses_task_id_index(self, db_path):
+        plan = _plan(db_path, criteria_mod._SQL_LIST_CRITERIA, (1,))
+        assert any("idx_acceptance_criteria_task_id" in step for step in plan), plan
+
+    def test_order_by_id_needs_no_sort(self, db_path):
+        plan = _plan(db_path, criteria_mod._SQL_LIST_CRITERIA, (1,))
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+        assert not any(step.startswith("SCAN c") for step in plan), plan
@@ -0,0 +1,96 @@
+"""Unit tests for tusk criteria reset.
+
+cmd_reset reads the criterion first so the no-op outcomes ("not found",
+"already incomplete") never open a write transaction; only an actual reset
+runs the guarded UPDATE.
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import sqlite3
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_spec = importlib.util.spec_from_file_location(
+    "tusk_criteria",
+    os.path.join(REPO_ROOT, "bin", "tusk-criteria.py"),
+)
+criteria_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(criteria_mod)
+
+
+class _NoCloseConn:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        pass
+
+
+def _make_db(is_completed=0, is_deferred=0):
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE acceptance_criteria ("
+        "  id INTEGER PRIMARY KEY, task_id INTEGER, criterion TEXT,"
+        "  is_completed INTEGER DEFAULT 0, completed_at TEXT,"
+        "  cost_dollars REAL, tokens_in INTEGER, tokens_out INTEGER,"
+        "  verification_result TEXT, commit_hash TEXT, committed_at TEXT,"
+        "  is_deferred INTEGER DEFAULT 0, deferred_reason TEXT, skip_note TEXT,"
+        "  updated_at TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO acceptance_criteria (id, task_id, criterion, is_completed, "
+        "completed_at, commit_hash, is_deferred) VALUES (1, 7, 'crit', ?, ?, ?, ?)",
+        (is_completed, "2026-01-01 00:00:00.000" if is_completed else None,
+         "abc1234" if is_completed else None, is_deferred),
+    )
+    conn.commit()
+    return conn
+
+
+def _run_reset(conn, criterion_id=1):
+    args = argparse.Namespace(criterion_id=criterion_id)
+    out, err = io.StringIO(), io.StringIO()
+    with patch.object(criteria_mod, "get_connection", return_value=_NoCloseConn(conn)), \
+         redirect_stdout(out), redirect_stderr(err):
+        rc = criteria_mod.cmd_reset(args, ":memory:", {})
+    return rc, out.getvalue(), err.getvalue()
+
+
+class TestCmdReset:
+    def test_resets_completed_criterion(self):
+        conn = _make_db(is_completed=1)
+        rc, out, _ = _run_reset(conn)
+        assert rc == 0
+        obj = json.loads(out)
+        assert obj["task_id"] == 7 and "already_incomplete" not in obj
+        row = conn.execute("SELECT * FROM acceptance_criteria WHERE id = 1").fetchone()
+        assert row["is_completed"] == 0
+        assert row["completed_at"] is None and row["commit_hash"] is None
+        assert row["updated_at"] is not None
+
+    def test_already_incomplete_opens_no_transaction(self):
+        conn = _make_db()
+        rc, out, _ = _run_reset(conn)
+        assert rc == 0
+        assert json.loads(out)["already_incomplete"] is True
+        assert not conn.in_transaction
+        row = conn.execute("SELECT updated_at FROM acceptance_criteria WHERE id = 1").fetchone()
+        assert row["updated_at"] is None
+
+    def test_not_found_returns_2(self):
+        conn = _make_db()
+        rc, out, err = _run_reset(conn, criterion_id=99)
+        assert rc == 2
+        assert out == ""
+        assert "Criterion 99 not found" in err
+        assert not conn.in_transaction
@@ -130,6 +130,27 @@ class TestModuleLoading:
         assert callable(mod.fetch_complexity_metrics)
 
 
+# ---------------------------------------------------------------------------
+# Enum columns are interned at fetch time
+# ---------------------------------------------------------------------------
+
+
+class TestEnumInterning:
+    def test_task_metrics_share_status_objects(self):
+        """Rows with the same status/complexity share one interned str object."""
+        conn = _make_conn()
+        for summary in ("a", "b"):
+            conn.execute(
+                "INSERT INTO tasks (summary, status, complexity) VALUES (?, ?, ?)",
+                (summary, "To Do", "M"),
+            )
+        conn.commit()
+
+        first, second = dashboard_data.fetch_task_metrics(conn)
+        assert first["status"] is second["status"]
+        assert first["complexity"] is second["complexity"]
+
+
 # ---------------------------------------------------------------------------
 # duration_in_status_seconds: To Do branch
 # ---------------------------------------------------------------------------
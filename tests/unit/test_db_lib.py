@@ -36,6 +36,14 @@ class TestGetConnection:
         assert row["b"] == "hello"
         conn.close()
 
+    def test_row_factory_can_be_disabled(self, tmp_path):
+        conn = db_lib.get_connection(str(tmp_path / "test.db"), row_factory=None)
+        assert conn.row_factory is None
+        row = conn.execute("SELECT 1, 'x'").fetchone()
+        assert type(row) is tuple
+        assert row == (1, "x")
+        conn.close()
+
     def test_foreign_keys_enabled(self, tmp_path):
         conn = db_lib.get_connection(str(tmp_path / "test.db"))
         result = conn.execute("PRAGMA foreign_keys").fetchone()
@@ -67,6 +75,16 @@ class TestGetConnection:
         assert result[0] == db_lib.DEFAULT_BUSY_TIMEOUT_MS
         conn.close()
 
+    def test_io_pragmas_applied(self, tmp_path):
+        conn = db_lib.get_connection(str(tmp_path / "test.db"))
+        # synchronous: 1 == NORMAL; temp_store: 2 == MEMORY
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == db_lib.CACHE_SIZE_KIB
+        # mmap_size is clamped to SQLITE_MAX_MMAP_SIZE (0 when mmap is compiled out)
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] in (0, db_lib.MMAP_SIZE_BYTES)
+        conn.close()
+
     def test_creates_db_file(self, tmp_path):
         db_file = tmp_path / "new.db"
         assert not db_file.exists()
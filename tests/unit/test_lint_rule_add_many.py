@@ -0,0 +1,120 @@
+"""Unit tests for ``tusk lint-rule add-many`` — batched single-transaction inserts.
+
+Coverage:
+* ``inserts_all`` — every pattern<TAB>file_glob<TAB>message line lands as a
+  row, with --blocking/--advisory/--skill mapped exactly as ``add`` maps them.
+* ``malformed`` — a bad line rejects the whole batch before the DB is touched.
+* ``empty`` — input with no rules is an error.
+* ``parse`` — the line parser takes plain values, no argparse Namespace.
+"""
+
+import importlib.util
+import io
+import os
+import sqlite3
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BIN = os.path.join(REPO_ROOT, "bin")
+
+_rules_spec = importlib.util.spec_from_file_location(
+    "tusk_lint_rules", os.path.join(BIN, "tusk-lint-rules.py")
+)
+rules_mod = importlib.util.module_from_spec(_rules_spec)
+_rules_spec.loader.exec_module(rules_mod)
+
+
+_LINT_RULES_SCHEMA = """
+CREATE TABLE lint_rules (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    grep_pattern TEXT NOT NULL,
+    file_glob TEXT NOT NULL,
+    message TEXT NOT NULL,
+    is_blocking INTEGER NOT NULL DEFAULT 0,
+    source_skill TEXT,
+    enforcement TEXT NOT NULL DEFAULT 'enforcing',
+    created_at TEXT DEFAULT (datetime('now')),
+    CHECK (is_blocking IN (0, 1)),
+    CHECK (enforcement IN ('advisory', 'enforcing'))
+);
+"""
+
+
+def _make_db(tmp_path) -> str:
+    db_path = str(tmp_path / "tasks.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(_LINT_RULES_SCHEMA)
+    conn.close()
+    return db_path
+
+
+def _rows(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        return conn.execute("SELECT * FROM lint_rules ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+def _add_many(db_path, stdin_text, *args, monkeypatch) -> int:
+    monkeypatch.setattr(rules_mod.sys, "stdin", io.StringIO(stdin_text))
+    argv = ["tusk-lint-rules.py", db_path, "/dev/null", "add-many", *args]
+    return rules_mod.main(argv)
+
+
+def test_add_many_inserts_all(tmp_path, monkeypatch, capsys):
+    db = _make_db(tmp_path)
+    text = "TODO\t**/*.py\tno TODOs\n\nprint(\tbin/*.py\tno prints\n"
+
+    assert _add_many(db, text, "--blocking", "--skill", "retro", monkeypatch=monkeypatch) == 0
+    assert "Added 2 lint rules." in capsys.readouterr().out
+
+    rows = _rows(db)
+    assert [r["grep_pattern"] for r in rows] == ["TODO", "print("]
+    assert [r["is_blocking"] for r in rows] == [1, 1]
+    assert [r["enforcement"] for r in rows] == ["enforcing", "enforcing"]
+    assert [r["source_skill"] for r in rows] == ["retro", "retro"]
+
+
+def test_add_many_advisory_from_file(tmp_path, monkeypatch):
+    db = _make_db(tmp_path)
+    rules_file = tmp_path / "rules.tsv"
+    rules_file.write_text("XXX\t**/*.md\tno XXX\n", encoding="utf-8")
+
+    assert _add_many(db, "", "--file", str(rules_file), "--advisory",
+                     monkeypatch=monkeypatch) == 0
+
+    (row,) = _rows(db)
+    assert row["enforcement"] == "advisory"
+    assert row["is_blocking"] == 0
+
+
+def test_add_many_malformed_line_inserts_nothing(tmp_path, monkeypatch, capsys):
+    db = _make_db(tmp_path)
+    text = "TODO\t**/*.py\tno TODOs\nmissing-fields\n"
+
+    assert _add_many(db, text, monkeypatch=monkeypatch) == 2
+    assert "line 2" in capsys.readouterr().err
+    assert _rows(db) == []
+
+
+def test_add_many_empty_is_error(tmp_path, monkeypatch, capsys):
+    db = _make_db(tmp_path)
+    assert _add_many(db, "\n  \n", monkeypatch=monkeypatch) == 2
+    assert "no lint rules" in capsys.readouterr().err
+
+
+def test_add_many_single_rule_message_is_singular(tmp_path, monkeypatch, capsys):
+    db = _make_db(tmp_path)
+    assert _add_many(db, "TODO\t**/*.py\tno TODOs\n", monkeypatch=monkeypatch) == 0
+    assert "Added 1 lint rule." in capsys.readouterr().out
+
+
+def test_parse_add_many_lines_takes_explicit_flags():
+    rows, error = rules_mod._parse_add_many_lines(
+        ["TODO\t**/*.py\tno TODOs\n", "\n"],
+        blocking=False, advisory=True, skill=None,
+    )
+    assert error is None
+    assert rows == [rules_mod._rule_params("TODO", "**/*.py", "no TODOs",
+                                           blocking=False, advisory=True, skill=None)]
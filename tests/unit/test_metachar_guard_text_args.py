@@ -11,7 +11,7 @@ helper (reject_shell_metacharacters) in tusk-git-helpers.py so all surfaces stay
 in lockstep.
 
 The guard rejects rather than auto-escapes, and fires BEFORE any DB write (and,
-for criteria add, after the task-exists check but before the insert). The
+for criteria add, before the insert that also performs the task-exists check). The
 --description-file path on task-insert reads the file directly and is immune, so
 file-sourced descriptions are intentionally exempt. Typed-criterion specs (and
 file-type verification specs) are shell code by design and are NOT checked.